@@ -5,18 +5,25 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 import plotly.express as px
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as pa_ds
 from datetime import datetime
 import io
+import json
+import hashlib
 import time
 from helpers.config import get_settings, ManageDir
 from helpers.datasets import Datasets
-from helpers.dfc_algo import DFCAlgo
+from helpers.dfc_algo import DFCAlgo, DFC_ALGO_VERSION
+
+# Settings and helpers are process-wide singletons, so build them once instead of on every rerun
+@st.cache_resource(show_spinner=False)
+def get_handles():
+    return get_settings(), ManageDir(), Datasets(), DFCAlgo()
 
 # Get settings
-settings = get_settings()
-manage_dir = ManageDir()
-datasets = Datasets()
-dfc_algo = DFCAlgo()
+settings, manage_dir, datasets, dfc_algo = get_handles()
 
 # Set page configuration
 st.set_page_config(
@@ -36,33 +43,148 @@ if 'coverage_df' not in st.session_state:
     st.session_state.coverage_df = None
 if 'data_source' not in st.session_state:
     st.session_state.data_source = None
+if 'summary' not in st.session_state:
+    st.session_state.summary = None
+if 'cov_stats' not in st.session_state:
+    st.session_state.cov_stats = None
+
+# Arrow schemas of the columns the dashboard reads from each dataset, built once per process.
+# Quantities are read as float64 so fractional CSV values parse; downcast_quantities narrows whole-number columns
+@st.cache_resource
+def dataset_schemas():
+    return {
+        'forecast': pa.schema([
+            (settings.FORCAST_PRODUCT_ID, pa.string()),
+            (settings.FORCAST_DATE, pa.timestamp('ms')),
+            (settings.FORCAST_FORECASTED_SALES, pa.float64()),
+        ]),
+        'inventory': pa.schema([
+            (settings.INVENTORY_PRODUCT_ID, pa.string()),
+            (settings.INVENTORY_BATCH_ID, pa.string()),
+            (settings.INVENTORY_EXPIRY_DATE, pa.timestamp('ms')),
+            (settings.INVENTORY_INVENTORY, pa.float64()),
+        ]),
+        'coverage': pa.schema([
+            (settings.COVERAGE_PRODUCT_ID, pa.string()),
+            (settings.COVERAGE_DAYS_FORWARD_COVERAGE, pa.int64()),
+            (settings.COVERAGE_TOTAL_INVENTORY, pa.float64()),
+        ]),
+    }
+
+# Function to read one product's rows, with the product filter pushed down to the Arrow dataset scan
+def read_product_rows(path, table, product_column, product_id):
+    schema = dataset_schemas()[table]
+    if path.endswith(".parquet"):
+        dataset = pa_ds.dataset(path, format="parquet")
+    else:
+        convert_options = pa_csv.ConvertOptions(column_types=schema)
+        dataset = pa_ds.dataset(path, format=pa_ds.CsvFileFormat(convert_options=convert_options), schema=schema)
+    return dataset.to_table(columns=schema.names, filter=pa_ds.field(product_column) == product_id).to_pandas()
 
-# Function to load data from files
-@st.cache_data
-def load_data_from_files():
-    forecast_path = manage_dir.get_forecast_path()
-    inventory_path = manage_dir.get_inventory_path()
-    coverage_path = manage_dir.get_coverage_path()
+# Function to read an uploaded file, falling back to CSV parsing for .csv uploads
+def read_uploaded_file(uploaded_file, date_columns=()):
+    if uploaded_file.name.lower().endswith(".parquet"):
+        return pd.read_parquet(uploaded_file, engine="pyarrow")
+    
+    df = pd.read_csv(uploaded_file)
+    for column in date_columns:
+        df[column] = pd.to_datetime(df[column])
+    return df
+
+# Function to share one categorical dtype for product IDs across datasets, so groupby/isin run on integer codes
+def categorize_product_ids(forecast_df, inventory_df, coverage_df):
+    product_columns = [
+        (forecast_df, settings.FORCAST_PRODUCT_ID),
+        (inventory_df, settings.INVENTORY_PRODUCT_ID),
+        (coverage_df, settings.COVERAGE_PRODUCT_ID),
+    ]
+    product_columns = [(df, column) for df, column in product_columns if df is not None]
+    if not product_columns:
+        return forecast_df, inventory_df, coverage_df
     
-    # Check if files exist
-    forecast_exists = os.path.exists(forecast_path)
-    inventory_exists = os.path.exists(inventory_path)
-    coverage_exists = os.path.exists(coverage_path)
+    # Missing IDs are left out of the categories and keep NaN codes
+    all_ids = np.asarray(product_columns[0][0][product_columns[0][1]].dropna().unique())
+    for df, column in product_columns[1:]:
+        all_ids = np.union1d(all_ids, np.asarray(df[column].dropna().unique()))
     
-    # Load data if files exist
-    forecast_df = pd.read_csv(forecast_path) if forecast_exists else None
-    inventory_df = pd.read_csv(inventory_path) if inventory_exists else None
-    coverage_df = pd.read_csv(coverage_path) if coverage_exists else None
+    dtype = pd.CategoricalDtype(pd.Index(all_ids))
+    for df, column in product_columns:
+        df[column] = df[column].astype(dtype)
     
-    # Convert date columns to datetime
-    if forecast_df is not None:
-        forecast_df[settings.FORCAST_DATE] = pd.to_datetime(forecast_df[settings.FORCAST_DATE])
+    return forecast_df, inventory_df, coverage_df
+
+# Function to store quantity columns in the smallest integer type that holds them
+def downcast_quantities(forecast_df, inventory_df, coverage_df):
+    quantity_columns = [
+        (forecast_df, [settings.FORCAST_FORECASTED_SALES]),
+        (inventory_df, [settings.INVENTORY_INVENTORY]),
+        (coverage_df, [settings.COVERAGE_DAYS_FORWARD_COVERAGE, settings.COVERAGE_TOTAL_INVENTORY]),
+    ]
+    for df, columns in quantity_columns:
+        if df is None:
+            continue
+        for column in columns:
+            df[column] = pd.to_numeric(df[column], downcast="integer")
     
-    if inventory_df is not None:
-        inventory_df[settings.INVENTORY_EXPIRY_DATE] = pd.to_datetime(inventory_df[settings.INVENTORY_EXPIRY_DATE])
+    return forecast_df, inventory_df, coverage_df
+
+# Function to index coverage data by product so selected products are hash lookups, not full scans
+def index_coverage(coverage_df):
+    if coverage_df is None:
+        return None
+    return coverage_df.set_index(settings.COVERAGE_PRODUCT_ID, drop=False).rename_axis(None)
+
+# Function to look up products in the product-indexed coverage data
+def select_products(coverage_df, product_ids):
+    try:
+        return coverage_df.loc[product_ids]
+    except KeyError:
+        # Some IDs are not in this frame (e.g. filtered out), keep the ones that are
+        return coverage_df[coverage_df.index.isin(product_ids)]
+
+# Function to read the data files; their modification times are part of the cache key, so rewritten files are read again.
+# Only the current files' deferred and full reads are kept, older versions are evicted
+@st.cache_data(max_entries=2)
+def read_data_files(forecast_path, inventory_path, coverage_path, modified, load_datasets=True):
+    schemas = dataset_schemas()
+    forecast_df = None
+    inventory_df = None
+    if load_datasets and forecast_path is not None:
+        forecast_df = datasets.read_dataset(forecast_path, schemas['forecast'])
+    if load_datasets and inventory_path is not None:
+        inventory_df = datasets.read_dataset(inventory_path, schemas['inventory'])
+    coverage_df = datasets.read_dataset(coverage_path, schemas['coverage']) if coverage_path is not None else None
+    
+    forecast_df, inventory_df, coverage_df = categorize_product_ids(forecast_df, inventory_df, coverage_df)
+    forecast_df, inventory_df, coverage_df = downcast_quantities(forecast_df, inventory_df, coverage_df)
+    
+    return forecast_df, inventory_df, coverage_df
+
+# Function to load data from files, optionally leaving the forecast and inventory frames unread
+def load_data_from_files(load_datasets=True):
+    forecast_path = manage_dir.get_latest_forecast_path()
+    inventory_path = manage_dir.get_latest_inventory_path()
+    coverage_path = manage_dir.get_latest_coverage_path()
+    
+    # Check if files exist
+    forecast_exists = forecast_path is not None
+    inventory_exists = inventory_path is not None
+    coverage_exists = coverage_path is not None
+    
+    # Load data if files exist
+    paths = (forecast_path, inventory_path, coverage_path)
+    modified = tuple(os.path.getmtime(path) if path is not None else None for path in paths)
+    forecast_df, inventory_df, coverage_df = read_data_files(*paths, modified, load_datasets)
     
     return forecast_df, inventory_df, coverage_df, forecast_exists, inventory_exists, coverage_exists
 
+# Function to load the full forecast and inventory frames when the summary deferred them
+def ensure_datasets_loaded():
+    if st.session_state.forecast_df is None or st.session_state.inventory_df is None:
+        forecast_df, inventory_df, *_ = load_data_from_files()
+        st.session_state.forecast_df = forecast_df
+        st.session_state.inventory_df = inventory_df
+
 # Function to generate synthetic data
 def generate_data():
     start_date = datetime.strptime(settings.START_DATE, '%Y-%m-%d')
@@ -79,23 +201,236 @@ def generate_data():
     with st.spinner('Generating inventory dataset...'):
         inventory_df = datasets.generate_inventory_dataset(product_ids, start_date, end_date)
     
-    # Convert date columns to datetime
-    forecast_df[settings.FORCAST_DATE] = pd.to_datetime(forecast_df[settings.FORCAST_DATE])
-    inventory_df[settings.INVENTORY_EXPIRY_DATE] = pd.to_datetime(inventory_df[settings.INVENTORY_EXPIRY_DATE])
+    # Convert date columns to datetime, unless the generators already produced datetime64
+    if not pd.api.types.is_datetime64_any_dtype(forecast_df[settings.FORCAST_DATE]):
+        forecast_df[settings.FORCAST_DATE] = pd.to_datetime(forecast_df[settings.FORCAST_DATE])
+    if not pd.api.types.is_datetime64_any_dtype(inventory_df[settings.INVENTORY_EXPIRY_DATE]):
+        inventory_df[settings.INVENTORY_EXPIRY_DATE] = pd.to_datetime(inventory_df[settings.INVENTORY_EXPIRY_DATE])
     
-    # Save datasets to CSV files
-    forecast_df.to_csv(manage_dir.get_forecast_path(), index=False)
-    inventory_df.to_csv(manage_dir.get_inventory_path(), index=False)
+    # Save datasets in the configured format, followed by their summary
+    datasets.save_dataset(forecast_df, manage_dir.get_forecast_path(), manage_dir.get_forecast_parquet_path(), date_columns=[settings.FORCAST_DATE])
+    datasets.save_dataset(inventory_df, manage_dir.get_inventory_path(), manage_dir.get_inventory_parquet_path(), date_columns=[settings.INVENTORY_EXPIRY_DATE])
+    save_summary(build_summary(forecast_df, inventory_df))
     
     return forecast_df, inventory_df
 
-# Function to calculate Days Forward Coverage
+# Number of coverage results kept in the disk cache, least recently used ones are deleted first
+COVERAGE_CACHE_ENTRIES = 8
+
+# Content fingerprint of the coverage inputs and algorithm version, used as the disk cache key
+def coverage_fingerprint(forecast_df, inventory_df):
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(f'{DFC_ALGO_VERSION}:{settings.START_DATE}'.encode())
+    for df in (forecast_df, inventory_df):
+        # Hash dates at one resolution so generated and reloaded frames share a key
+        date_columns = df.select_dtypes('datetime').columns
+        df = df.astype({column: 'datetime64[ns]' for column in date_columns})
+        digest.update(repr(df.shape).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+# Function to calculate Days Forward Coverage, reusing a cached result for identical inputs
 def calculate_coverage(forecast_df, inventory_df):
-    with st.spinner('Calculating Days Forward Coverage...'):
-        coverage_df = dfc_algo.calculate_dfc(forecast_df, inventory_df, settings.START_DATE, save_csv=True)
+    cache_path = manage_dir.get_coverage_cache_path(coverage_fingerprint(forecast_df, inventory_df))
+    if os.path.exists(cache_path):
+        coverage_df = pd.read_parquet(cache_path)
+        # Mark the entry as recently used, so pruning removes older results first
+        os.utime(cache_path)
+    else:
+        with st.spinner('Calculating Days Forward Coverage...'):
+            coverage_df = dfc_algo.calculate_dfc(forecast_df, inventory_df, settings.START_DATE, save_csv=False)
+        datasets.save_parquet(coverage_df, cache_path)
+        manage_dir.prune_coverage_cache(keep=COVERAGE_CACHE_ENTRIES)
+    datasets.save_parquet(coverage_df, manage_dir.get_coverage_parquet_path())
     
     return coverage_df
 
+# Cheap DataFrame fingerprint so cached aggregations skip Streamlit's full-frame hashing
+def frame_signature(df):
+    edge_rows = df.iloc[[0, -1]] if len(df) else df
+    return id(df), df.shape, int(pd.util.hash_pandas_object(edge_rows, index=False).sum())
+
+CACHE_HASH_FUNCS = {pd.DataFrame: frame_signature}
+
+# Cached aggregations used by the dashboard panels
+@st.cache_data(show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def daily_forecast(forecast_df):
+    return forecast_df.groupby(settings.FORCAST_DATE)[settings.FORCAST_FORECASTED_SALES].sum().reset_index()
+
+@st.cache_data(show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def batches_per_product(inventory_df):
+    return inventory_df.groupby(settings.INVENTORY_PRODUCT_ID, observed=True).size().reset_index(name='batch_count')
+
+@st.cache_data(show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def total_inventory(inventory_df, n=20):
+    totals = inventory_df.groupby(settings.INVENTORY_PRODUCT_ID, observed=True)[settings.INVENTORY_INVENTORY].sum().reset_index()
+    return totals.sort_values(settings.INVENTORY_INVENTORY, ascending=False).head(n)
+
+@st.cache_data(show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def top_bottom_coverage(coverage_df, n=10):
+    dfc = coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE].to_numpy().astype(np.float64)
+    
+    # One partition pass finds the n-th smallest and n-th largest values; every row tied with them
+    # stays a candidate, so the rows kept among ties are picked by position below
+    if len(dfc) > 2 * n:
+        partitioned = np.partition(dfc, [n - 1, len(dfc) - n])
+        top_idx = np.flatnonzero(dfc >= partitioned[len(dfc) - n])
+        bottom_idx = np.flatnonzero(dfc <= partitioned[n - 1])
+    else:
+        top_idx = bottom_idx = np.arange(len(dfc))
+    
+    # Order each selection for display, ties by row position
+    top_idx = top_idx[np.lexsort((top_idx, -dfc[top_idx]))][:n]
+    bottom_idx = bottom_idx[np.lexsort((bottom_idx, dfc[bottom_idx]))][:n]
+    return coverage_df.iloc[top_idx], coverage_df.iloc[bottom_idx]
+
+@st.cache_data(show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def critical_coverage(coverage_df, threshold=7):
+    critical_products = coverage_df[coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE] < threshold]
+    return critical_products.sort_values(settings.COVERAGE_DAYS_FORWARD_COVERAGE)
+
+# Coverage statistics computed in one pass when the coverage data is set, then read from session state
+def coverage_stats(coverage_df):
+    if coverage_df is None:
+        return None
+    dfc = coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE].to_numpy()
+    return dict(
+        min=int(dfc.min()),
+        max=int(dfc.max()),
+        mean=float(dfc.mean()),
+        std=float(dfc.std()),
+        count=len(dfc)
+    )
+
+@st.cache_data(show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def sorted_product_ids(coverage_df):
+    product_ids = coverage_df[settings.COVERAGE_PRODUCT_ID]
+    if isinstance(product_ids.dtype, pd.CategoricalDtype) and product_ids.cat.categories.is_monotonic_increasing:
+        # Categories are already sorted, keep only the ones present in the coverage data
+        sorted_products = product_ids.cat.remove_unused_categories().cat.categories.to_numpy()
+    else:
+        # Sort the unique IDs rather than every row
+        sorted_products = np.sort(product_ids.unique())
+    return sorted_products
+
+# Histogram bins computed server-side, so Plotly receives one bar per bin instead of every row
+@st.cache_data(show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def histogram_bins(df, column, bins=30):
+    values = df[column].to_numpy()
+    is_datetime = np.issubdtype(values.dtype, np.datetime64)
+    is_integer = np.issubdtype(values.dtype, np.integer)
+    if is_datetime:
+        values = values.astype('datetime64[ns]').view('int64')
+    
+    if (is_integer or is_datetime) and len(values):
+        # Edges on whole values, so each bar holds one value or the same count of values: integers are
+        # centred on their bar, dates are counted in whole days from midnight
+        unit, offset = (np.timedelta64(1, 'D') // np.timedelta64(1, 'ns'), 0) if is_datetime else (1, -0.5)
+        lo, hi = int(values.min()) // unit, int(values.max()) // unit
+        width = -(-(hi - lo + 1) // bins)
+        bins = (lo + offset + width * np.arange(-(-(hi - lo + 1) // width) + 1)) * unit
+
+    counts, edges = np.histogram(values, bins=bins)
+    centers = (edges[:-1] + edges[1:]) / 2
+    if is_datetime:
+        centers = pd.to_datetime(centers.astype('int64'))
+    
+    return pd.DataFrame({column: centers, 'count': counts})
+
+# Function to plot pre-binned histogram counts as a gapless bar chart
+def histogram_figure(hist_df, column, **kwargs):
+    fig = px.bar(hist_df, x=column, y='count', **kwargs)
+    fig.update_layout(bargap=0)
+    return fig
+
+# Summary tables and their date columns, used to restore dtypes when reading summary.json
+SUMMARY_TABLES = {
+    'daily_forecast': [settings.FORCAST_DATE],
+    'forecast_histogram': [],
+    'batches_histogram': [],
+    'expiry_histogram': [settings.INVENTORY_EXPIRY_DATE],
+    'total_inventory_top20': [],
+    'forecast_sample': [settings.FORCAST_DATE],
+    'inventory_sample': [settings.INVENTORY_EXPIRY_DATE],
+}
+
+# Function to compute everything the data exploration panels display
+@st.cache_data(show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def build_summary(forecast_df, inventory_df):
+    return {
+        'n_products': int(forecast_df[settings.FORCAST_PRODUCT_ID].nunique()),
+        'date_min': forecast_df[settings.FORCAST_DATE].min().strftime('%Y-%m-%d'),
+        'date_max': forecast_df[settings.FORCAST_DATE].max().strftime('%Y-%m-%d'),
+        'n_products_inventory': int(inventory_df[settings.INVENTORY_PRODUCT_ID].nunique()),
+        'total_batches': len(inventory_df),
+        'expiry_min': inventory_df[settings.INVENTORY_EXPIRY_DATE].min().strftime('%Y-%m-%d'),
+        'expiry_max': inventory_df[settings.INVENTORY_EXPIRY_DATE].max().strftime('%Y-%m-%d'),
+        'daily_forecast': daily_forecast(forecast_df),
+        'forecast_histogram': histogram_bins(forecast_df, settings.FORCAST_FORECASTED_SALES, bins=30),
+        'batches_histogram': histogram_bins(batches_per_product(inventory_df), 'batch_count', bins=20),
+        'expiry_histogram': histogram_bins(inventory_df, settings.INVENTORY_EXPIRY_DATE, bins=30),
+        'total_inventory_top20': total_inventory(inventory_df, n=20),
+        'forecast_sample': forecast_df.iloc[:100],
+        'inventory_sample': inventory_df.iloc[:100],
+    }
+
+# Function to write the summary next to the datasets
+def save_summary(summary):
+    payload = {
+        key: json.loads(value.to_json(orient='split', index=False, date_format='iso')) if key in SUMMARY_TABLES else value
+        for key, value in summary.items()
+    }
+    with open(manage_dir.get_summary_path(), 'w') as f:
+        json.dump(payload, f)
+
+# Function to read the summary, or None if it is missing or older than the datasets it describes
+def load_summary():
+    summary_path = manage_dir.get_summary_path()
+    data_paths = [
+        manage_dir.get_latest_forecast_path(),
+        manage_dir.get_latest_inventory_path(),
+    ]
+    if not os.path.exists(summary_path) or None in data_paths:
+        return None
+    if os.path.getmtime(summary_path) < max(os.path.getmtime(path) for path in data_paths):
+        return None
+    
+    with open(summary_path) as f:
+        summary = json.load(f)
+    if not SUMMARY_TABLES.keys() <= summary.keys():
+        return None
+    
+    for key, date_columns in SUMMARY_TABLES.items():
+        table = pd.DataFrame(summary[key]['data'], columns=summary[key]['columns'])
+        for column in date_columns:
+            table[column] = pd.to_datetime(table[column])
+        summary[key] = table
+    
+    return summary
+
+# DFC over time is cached per product, so revisiting a product in the dropdown is a cache hit
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs=CACHE_HASH_FUNCS)
+def dfc_over_time_cached(forecast_df, inventory_df, product_id):
+    return dfc_algo.calculate_dfc_over_time(forecast_df, inventory_df, product_id)
+
+# Same for the deferred path, which reads only the product's rows; keyed on the files and their modification times
+@st.cache_data(max_entries=64, show_spinner=False)
+def dfc_over_time_from_files(forecast_path, inventory_path, modified, product_id):
+    forecast_df = read_product_rows(forecast_path, 'forecast', settings.FORCAST_PRODUCT_ID, product_id)
+    inventory_df = read_product_rows(inventory_path, 'inventory', settings.INVENTORY_PRODUCT_ID, product_id)
+    forecast_df, inventory_df, _ = downcast_quantities(forecast_df, inventory_df, None)
+    return dfc_algo.calculate_dfc_over_time(forecast_df, inventory_df, product_id)
+
+# Function to get DFC over time for one product, without loading the full frames when the summary deferred them
+def product_dfc_over_time(product_id):
+    if st.session_state.forecast_df is not None and st.session_state.inventory_df is not None:
+        return dfc_over_time_cached(st.session_state.forecast_df, st.session_state.inventory_df, product_id)
+    
+    forecast_path = manage_dir.get_latest_forecast_path()
+    inventory_path = manage_dir.get_latest_inventory_path()
+    modified = (os.path.getmtime(forecast_path), os.path.getmtime(inventory_path))
+    return dfc_over_time_from_files(forecast_path, inventory_path, modified, product_id)
+
 # Dashboard title
 st.title("Days Forward Coverage Dashboard")
 st.markdown("### Mahmoud Nada's Data Scientist Technical Assessment")
@@ -114,9 +449,9 @@ if data_source_tab == "Upload Data":
     st.sidebar.subheader("Upload Data Files")
     
     # File uploaders
-    forecast_file = st.sidebar.file_uploader("Upload Forecast Data (CSV)", type="csv")
-    inventory_file = st.sidebar.file_uploader("Upload Inventory Data (CSV)", type="csv")
-    coverage_file = st.sidebar.file_uploader("Upload Days Forward Coverage Data (CSV)", type="csv", help="Optional")
+    forecast_file = st.sidebar.file_uploader("Upload Forecast Data (CSV or Parquet)", type=["csv", "parquet"])
+    inventory_file = st.sidebar.file_uploader("Upload Inventory Data (CSV or Parquet)", type=["csv", "parquet"])
+    coverage_file = st.sidebar.file_uploader("Upload Days Forward Coverage Data (CSV or Parquet)", type=["csv", "parquet"], help="Optional")
     
     if st.sidebar.button("Load Uploaded Data"):
         # Check if required files are uploaded
@@ -124,19 +459,21 @@ if data_source_tab == "Upload Data":
             st.sidebar.error("Please upload both forecast and inventory data files.")
         else:
             # Load data from uploaded files
-            st.session_state.forecast_df = pd.read_csv(forecast_file)
-            st.session_state.inventory_df = pd.read_csv(inventory_file)
-            
-            # Convert date columns to datetime
-            st.session_state.forecast_df[settings.FORCAST_DATE] = pd.to_datetime(st.session_state.forecast_df[settings.FORCAST_DATE])
-            st.session_state.inventory_df[settings.INVENTORY_EXPIRY_DATE] = pd.to_datetime(st.session_state.inventory_df[settings.INVENTORY_EXPIRY_DATE])
+            forecast_df = read_uploaded_file(forecast_file, date_columns=[settings.FORCAST_DATE])
+            inventory_df = read_uploaded_file(inventory_file, date_columns=[settings.INVENTORY_EXPIRY_DATE])
             
             # Check if coverage file is uploaded
-            if coverage_file is not None:
-                st.session_state.coverage_df = pd.read_csv(coverage_file)
-            else:
-                st.session_state.coverage_df = None
+            coverage_df = read_uploaded_file(coverage_file) if coverage_file is not None else None
             
+            forecast_df, inventory_df, coverage_df = categorize_product_ids(forecast_df, inventory_df, coverage_df)
+            forecast_df, inventory_df, coverage_df = downcast_quantities(forecast_df, inventory_df, coverage_df)
+            st.session_state.forecast_df = forecast_df
+            st.session_state.inventory_df = inventory_df
+            st.session_state.coverage_df = index_coverage(coverage_df)
+            st.session_state.cov_stats = coverage_stats(coverage_df)
+            
+            # Counts, date ranges and panel aggregates are computed once per load, not on every rerun
+            st.session_state.summary = build_summary(forecast_df, inventory_df)
             st.session_state.data_loaded = True
             st.session_state.data_source = "upload"
             st.sidebar.success("Data loaded successfully!")
@@ -147,8 +484,12 @@ elif data_source_tab == "Generate Data":
     
     if st.sidebar.button("Generate Data"):
         # Generate synthetic data
-        st.session_state.forecast_df, st.session_state.inventory_df = generate_data()
+        forecast_df, inventory_df = generate_data()
+        forecast_df, inventory_df, _ = categorize_product_ids(forecast_df, inventory_df, None)
+        st.session_state.forecast_df, st.session_state.inventory_df, _ = downcast_quantities(forecast_df, inventory_df, None)
         st.session_state.coverage_df = None
+        st.session_state.cov_stats = None
+        st.session_state.summary = build_summary(st.session_state.forecast_df, st.session_state.inventory_df)
         st.session_state.data_loaded = True
         st.session_state.data_source = "generate"
         st.sidebar.success("Data generated successfully!")
@@ -158,26 +499,40 @@ elif data_source_tab == "Use Existing Data":
     st.sidebar.subheader("Load Existing Data")
     
     if st.sidebar.button("Load Existing Data"):
+        # A fresh summary covers the data exploration panels, so the full frames are only read when needed
+        summary = load_summary()
+        
         # Load data from files
-        forecast_df, inventory_df, coverage_df, forecast_exists, inventory_exists, coverage_exists = load_data_from_files()
+        forecast_df, inventory_df, coverage_df, forecast_exists, inventory_exists, coverage_exists = load_data_from_files(load_datasets=summary is None)
         
         if not forecast_exists or not inventory_exists:
             st.sidebar.error("Required data files not found. Please generate data first or upload files.")
         else:
+            if summary is None:
+                summary = build_summary(forecast_df, inventory_df)
+                save_summary(summary)
+            
             st.session_state.forecast_df = forecast_df
             st.session_state.inventory_df = inventory_df
-            st.session_state.coverage_df = coverage_df
+            st.session_state.coverage_df = index_coverage(coverage_df)
+            st.session_state.cov_stats = coverage_stats(coverage_df)
+            st.session_state.summary = summary
             st.session_state.data_loaded = True
             st.session_state.data_source = "existing"
             st.sidebar.success("Data loaded successfully!")
             st.rerun()
 
 # Calculate Days Forward Coverage if needed
-if st.session_state.data_loaded and st.session_state.forecast_df is not None and st.session_state.inventory_df is not None and st.session_state.coverage_df is None:
+if st.session_state.data_loaded and st.session_state.coverage_df is None:
     st.sidebar.subheader("Calculate Days Forward Coverage")
     
     if st.sidebar.button("Calculate Coverage"):
-        st.session_state.coverage_df = calculate_coverage(st.session_state.forecast_df, st.session_state.inventory_df)
+        ensure_datasets_loaded()
+        coverage_df = calculate_coverage(st.session_state.forecast_df, st.session_state.inventory_df)
+        _, _, coverage_df = categorize_product_ids(st.session_state.forecast_df, st.session_state.inventory_df, coverage_df)
+        _, _, coverage_df = downcast_quantities(None, None, coverage_df)
+        st.session_state.coverage_df = index_coverage(coverage_df)
+        st.session_state.cov_stats = coverage_stats(coverage_df)
         st.sidebar.success("Days Forward Coverage calculated successfully!")
         st.rerun()
 
@@ -188,6 +543,8 @@ if st.session_state.data_loaded:
         st.session_state.forecast_df = None
         st.session_state.inventory_df = None
         st.session_state.coverage_df = None
+        st.session_state.cov_stats = None
+        st.session_state.summary = None
         st.session_state.data_source = None
         st.rerun()
 
@@ -195,8 +552,9 @@ if st.session_state.data_loaded:
 if st.session_state.data_loaded and st.session_state.coverage_df is not None:
     st.sidebar.header("Filters")
     
-    # Sort products by coverage (ascending)
-    sorted_products = st.session_state.coverage_df.sort_values(settings.COVERAGE_PRODUCT_ID)[settings.COVERAGE_PRODUCT_ID].unique()
+    # Sorted products are cached per coverage dataset, coverage bounds come from the stored statistics
+    sorted_products = sorted_product_ids(st.session_state.coverage_df)
+    min_coverage, max_coverage = st.session_state.cov_stats["min"], st.session_state.cov_stats["max"]
     
     # Select products
     selected_products = st.sidebar.multiselect(
@@ -206,24 +564,26 @@ if st.session_state.data_loaded and st.session_state.coverage_df is not None:
     )
     
     # Filter by coverage range
-    min_coverage = int(st.session_state.coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE].min())
-    max_coverage = int(st.session_state.coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE].max())
-    
     # coverage_range = st.sidebar.slider(
     #     "Days Forward Coverage Range:",
     #     min_value=min_coverage,
     #     max_value=max_coverage,
     #     value=(min_coverage, max_coverage)
     # )
+    coverage_range = (min_coverage, max_coverage)
     
     # Apply filters to coverage data
-    filtered_coverage = st.session_state.coverage_df[
-        (st.session_state.coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE] >= min_coverage) & 
-        (st.session_state.coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE] <= max_coverage)
-    ]
+    if coverage_range == (min_coverage, max_coverage):
+        # The full range keeps every product, so skip the pass over the data
+        filtered_coverage = st.session_state.coverage_df
+    else:
+        # Single fused range comparison, evaluated with numexpr when it is installed
+        filtered_coverage = st.session_state.coverage_df.query(
+            f"@coverage_range[0] <= `{settings.COVERAGE_DAYS_FORWARD_COVERAGE}` <= @coverage_range[1]"
+        )
     
     if selected_products:
-        filtered_coverage = filtered_coverage[filtered_coverage[settings.COVERAGE_PRODUCT_ID].isin(selected_products)]
+        filtered_coverage = select_products(filtered_coverage, selected_products)
 
 # Main dashboard content
 if not st.session_state.data_loaded:
@@ -246,26 +606,26 @@ else:
     # Forecast and Inventory Data Exploration - Shown First
     st.header("Data Exploration")
     
+    # KPIs and pre-aggregated panels, computed once when the data was loaded
+    summary = st.session_state.summary
+    
     # Create tabs for different datasets
     tab1, tab2 = st.tabs(["Forecast Data", "Inventory Data"])
     
     with tab1:
         st.subheader("Forecast Dataset")
         
-        if st.session_state.forecast_df is not None:
+        if summary is not None:
             # Summary of forecast data
-            st.write(f"Total products: {st.session_state.forecast_df[settings.FORCAST_PRODUCT_ID].nunique()}")
-            st.write(f"Date range: {st.session_state.forecast_df[settings.FORCAST_DATE].min().strftime('%Y-%m-%d')} to {st.session_state.forecast_df[settings.FORCAST_DATE].max().strftime('%Y-%m-%d')}")
+            st.write(f"Total products: {summary['n_products']}")
+            st.write(f"Date range: {summary['date_min']} to {summary['date_max']}")
             
             # Sample of forecast data
-            st.dataframe(st.session_state.forecast_df.head(100), use_container_width=True)
-            
-            # Aggregate forecast by date
-            daily_forecast = st.session_state.forecast_df.groupby(settings.FORCAST_DATE)[settings.FORCAST_FORECASTED_SALES].sum().reset_index()
+            st.dataframe(summary['forecast_sample'], use_container_width=True)
             
             # Plot daily forecast
             fig = px.line(
-                daily_forecast,
+                summary['daily_forecast'],
                 x=settings.FORCAST_DATE,
                 y=settings.FORCAST_FORECASTED_SALES,
                 title='Total Daily Forecast',
@@ -274,10 +634,9 @@ else:
             st.plotly_chart(fig, use_container_width=True)
             
             # Distribution of forecast values
-            fig = px.histogram(
-                st.session_state.forecast_df,
-                x=settings.FORCAST_FORECASTED_SALES,
-                nbins=30,
+            fig = histogram_figure(
+                summary['forecast_histogram'],
+                settings.FORCAST_FORECASTED_SALES,
                 title='Distribution of Forecasted Sales',
                 labels={settings.FORCAST_FORECASTED_SALES: 'Forecasted Sales'}
             )
@@ -286,42 +645,36 @@ else:
     with tab2:
         st.subheader("Inventory Dataset")
         
-        if st.session_state.inventory_df is not None:
+        if summary is not None:
             # Summary of inventory data
-            st.write(f"Total products: {st.session_state.inventory_df[settings.INVENTORY_PRODUCT_ID].nunique()}")
-            st.write(f"Total batches: {len(st.session_state.inventory_df)}")
-            st.write(f"Expiry date range: {st.session_state.inventory_df[settings.INVENTORY_EXPIRY_DATE].min().strftime('%Y-%m-%d')} to {st.session_state.inventory_df[settings.INVENTORY_EXPIRY_DATE].max().strftime('%Y-%m-%d')}")
+            st.write(f"Total products: {summary['n_products_inventory']}")
+            st.write(f"Total batches: {summary['total_batches']}")
+            st.write(f"Expiry date range: {summary['expiry_min']} to {summary['expiry_max']}")
             
             # Sample of inventory data
-            st.dataframe(st.session_state.inventory_df.head(100), use_container_width=True)
+            st.dataframe(summary['inventory_sample'], use_container_width=True)
             
             # Batches per product distribution
-            batches_per_product = st.session_state.inventory_df.groupby(settings.INVENTORY_PRODUCT_ID).size().reset_index(name='batch_count')
-            
-            fig = px.histogram(
-                batches_per_product,
-                x='batch_count',
-                nbins=20,
+            fig = histogram_figure(
+                summary['batches_histogram'],
+                'batch_count',
                 title='Distribution of Batches per Product',
                 labels={'batch_count': 'Number of Batches'}
             )
             st.plotly_chart(fig, use_container_width=True)
             
             # Expiry date distribution
-            fig = px.histogram(
-                st.session_state.inventory_df,
-                x=settings.INVENTORY_EXPIRY_DATE,
+            fig = histogram_figure(
+                summary['expiry_histogram'],
+                settings.INVENTORY_EXPIRY_DATE,
                 title='Distribution of Expiry Dates',
                 labels={settings.INVENTORY_EXPIRY_DATE: 'Expiry Date'}
             )
             st.plotly_chart(fig, use_container_width=True)
             
             # Total inventory by product
-            total_inventory = st.session_state.inventory_df.groupby(settings.INVENTORY_PRODUCT_ID)[settings.INVENTORY_INVENTORY].sum().reset_index()
-            total_inventory = total_inventory.sort_values(settings.INVENTORY_INVENTORY, ascending=False).head(20)
-            
             fig = px.bar(
-                total_inventory,
+                summary['total_inventory_top20'],
                 x=settings.INVENTORY_PRODUCT_ID,
                 y=settings.INVENTORY_INVENTORY,
                 title='Top 20 Products by Total Inventory',
@@ -340,133 +693,126 @@ else:
             st.subheader("Days Forward Coverage Overview")
             
             # Summary statistics
-            st.metric("Average Coverage", f"{st.session_state.coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE].mean():.1f} days")
+            st.metric("Average Coverage", f"{st.session_state.cov_stats['mean']:.1f} days")
             
             # Coverage distribution
-            fig = px.histogram(
-                st.session_state.coverage_df, 
-                x=settings.COVERAGE_DAYS_FORWARD_COVERAGE,
-                nbins=30,
+            fig = histogram_figure(
+                histogram_bins(st.session_state.coverage_df, settings.COVERAGE_DAYS_FORWARD_COVERAGE, bins=30),
+                settings.COVERAGE_DAYS_FORWARD_COVERAGE,
                 title='Distribution of Days Forward Coverage',
                 labels={settings.COVERAGE_DAYS_FORWARD_COVERAGE: 'Days Forward Coverage'},
                 color_discrete_sequence=['#3366CC']
             )
             st.plotly_chart(fig, use_container_width=True)
             
-            # # Time Series Chart (DFC Over Time)
-            # st.subheader("Days Forward Coverage Over Time")
-            
-            # # Add a container for the loading indicator
-            # loading_container = st.empty()
-            
-            # # Initialize or get the previous selection from session state
-            # if 'selected_product_for_timeseries' not in st.session_state:
-            #     # Default to a product with medium coverage
-            #     medium_coverage_products = st.session_state.coverage_df.sort_values(settings.COVERAGE_DAYS_FORWARD_COVERAGE)
-            #     if not medium_coverage_products.empty:
-            #         default_product = medium_coverage_products.iloc[len(medium_coverage_products)//2][settings.COVERAGE_PRODUCT_ID]
-            #     else:
-            #         default_product = None
-            #     st.session_state.selected_product_for_timeseries = default_product
-            #     st.session_state.is_calculating_dfc = False
-            
-            # # Track if we need to show the loading indicator
-            # if 'is_calculating_dfc' not in st.session_state:
-            #     st.session_state.is_calculating_dfc = False
-            
-            # # Show loading indicator if calculation is in progress
-            # if st.session_state.is_calculating_dfc:
-            #     with loading_container:
-            #         st.info(f"⏳ Loading DFC data for {st.session_state.selected_product_for_timeseries}... Please wait.")
-            
-            # # Product selection dropdown
-            # selected_product = st.selectbox(
-            #     "Select Product to View DFC Over Time:",
-            #     options=st.session_state.coverage_df[settings.COVERAGE_PRODUCT_ID].unique(),
-            #     index=list(st.session_state.coverage_df[settings.COVERAGE_PRODUCT_ID].unique()).index(st.session_state.selected_product_for_timeseries) 
-            #           if st.session_state.selected_product_for_timeseries in st.session_state.coverage_df[settings.COVERAGE_PRODUCT_ID].unique() else 0,
-            #     key="dfc_product_selector"
-            # )
-            
-            # # Check if product selection has changed
-            # if selected_product != st.session_state.selected_product_for_timeseries:
-            #     st.session_state.selected_product_for_timeseries = selected_product
-            #     st.session_state.is_calculating_dfc = True
-            #     st.rerun()
+            # Time Series Chart (DFC Over Time)
+            st.subheader("Days Forward Coverage Over Time")
+            
+            # Add a container for the loading indicator
+            loading_container = st.empty()
+            
+            # Initialize or get the previous selection from session state
+            if 'selected_product_for_timeseries' not in st.session_state:
+                # Default to a product with medium coverage
+                medium_coverage_products = st.session_state.coverage_df.sort_values(settings.COVERAGE_DAYS_FORWARD_COVERAGE)
+                if not medium_coverage_products.empty:
+                    default_product = medium_coverage_products.iloc[len(medium_coverage_products)//2][settings.COVERAGE_PRODUCT_ID]
+                else:
+                    default_product = None
+                st.session_state.selected_product_for_timeseries = default_product
+                st.session_state.is_calculating_dfc = False
+            
+            # Track if we need to show the loading indicator
+            if 'is_calculating_dfc' not in st.session_state:
+                st.session_state.is_calculating_dfc = False
+            
+            # Show loading indicator if calculation is in progress
+            if st.session_state.is_calculating_dfc:
+                with loading_container:
+                    st.info(f"⏳ Loading DFC data for {st.session_state.selected_product_for_timeseries}... Please wait.")
+            
+            # Product selection dropdown
+            timeseries_products = list(sorted_products)
+            selected_product = st.selectbox(
+                "Select Product to View DFC Over Time:",
+                options=timeseries_products,
+                index=timeseries_products.index(st.session_state.selected_product_for_timeseries) 
+                      if st.session_state.selected_product_for_timeseries in timeseries_products else 0,
+                key="dfc_product_selector"
+            )
             
-            # # Calculate DFC over time for the selected product
-            # with st.spinner(f"Calculating DFC over time for {selected_product}..."):
-            #     # Show loading message in the container while calculating
-            #     with loading_container:
-            #         st.info(f"⏳ Loading DFC data for {selected_product}... Please wait.")
+            # Check if product selection has changed
+            if selected_product != st.session_state.selected_product_for_timeseries:
+                st.session_state.selected_product_for_timeseries = selected_product
+                st.session_state.is_calculating_dfc = True
+                st.rerun()
+            
+            # Calculate DFC over time for the selected product, reading only its rows when the full frames were deferred
+            with st.spinner(f"Calculating DFC over time for {selected_product}..."):
+                # Show loading message in the container while calculating
+                with loading_container:
+                    st.info(f"⏳ Loading DFC data for {selected_product}... Please wait.")
                     
-            #     # Set flag to indicate calculation is in progress
-            #     st.session_state.is_calculating_dfc = True
-            #     dfc_over_time = dfc_algo.calculate_dfc_over_time(
-            #         st.session_state.forecast_df, 
-            #         st.session_state.inventory_df, 
-            #         selected_product
-            #     )
+                # Set flag to indicate calculation is in progress
+                st.session_state.is_calculating_dfc = True
+                dfc_over_time = product_dfc_over_time(selected_product)
                 
-            #     # Clear the calculating flag once done
-            #     st.session_state.is_calculating_dfc = False
+                # Clear the calculating flag once done
+                st.session_state.is_calculating_dfc = False
                 
-            #     # Show success message in the loading container
-            #     with loading_container:
-            #         if not dfc_over_time.empty:
-            #             st.success(f"✅ DFC data for {selected_product} loaded successfully!")
-            #         else:
-            #             st.warning(f"⚠️ No DFC data available for {selected_product}.")
-                        
-            #     # Add a small delay to ensure the success message is visible
-            #     time.sleep(0.5)
-            
-            # if not dfc_over_time.empty:
-            #     # Create time series chart
-            #     fig = px.line(
-            #         dfc_over_time,
-            #         x='date',
-            #         y='days_forward_coverage',
-            #         title=f'Days Forward Coverage Over Time for {selected_product}',
-            #         labels={'date': 'Date', 'days_forward_coverage': 'Days Forward Coverage'},
-            #         markers=True
-            #     )
+                # Show success message in the loading container
+                with loading_container:
+                    if not dfc_over_time.empty:
+                        st.success(f"✅ DFC data for {selected_product} loaded successfully!")
+                    else:
+                        st.warning(f"⚠️ No DFC data available for {selected_product}.")
+            
+            if not dfc_over_time.empty:
+                # Create time series chart
+                fig = px.line(
+                    dfc_over_time,
+                    x='date',
+                    y='days_forward_coverage',
+                    title=f'Days Forward Coverage Over Time for {selected_product}',
+                    labels={'date': 'Date', 'days_forward_coverage': 'Days Forward Coverage'},
+                    markers=True
+                )
                 
-            #     # Add a reference line at 7 days (critical threshold)
-            #     fig.add_shape(
-            #         type="line",
-            #         x0=dfc_over_time['date'].min(),
-            #         y0=7,
-            #         x1=dfc_over_time['date'].max(),
-            #         y1=7,
-            #         line=dict(color="red", width=2, dash="dash"),
-            #     )
+                # Add a reference line at 7 days (critical threshold)
+                fig.add_shape(
+                    type="line",
+                    x0=dfc_over_time['date'].min(),
+                    y0=7,
+                    x1=dfc_over_time['date'].max(),
+                    y1=7,
+                    line=dict(color="red", width=2, dash="dash"),
+                )
                 
-            #     # Add annotation for the reference line
-            #     fig.add_annotation(
-            #         x=dfc_over_time['date'].max(),
-            #         y=7,
-            #         text="Critical Threshold (7 days)",
-            #         showarrow=False,
-            #         yshift=10,
-            #         font=dict(color="red")
-            #     )
+                # Add annotation for the reference line
+                fig.add_annotation(
+                    x=dfc_over_time['date'].max(),
+                    y=7,
+                    text="Critical Threshold (7 days)",
+                    showarrow=False,
+                    yshift=10,
+                    font=dict(color="red")
+                )
                 
-            #     st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True)
                 
-            #     # Add insights about the DFC trend
-            #     initial_dfc = dfc_over_time.iloc[0]['days_forward_coverage']
-            #     final_dfc = dfc_over_time.iloc[-1]['days_forward_coverage']
-            #     min_dfc = dfc_over_time['days_forward_coverage'].min()
-            #     max_dfc = dfc_over_time['days_forward_coverage'].max()
+                # Add insights about the DFC trend
+                initial_dfc = dfc_over_time.iloc[0]['days_forward_coverage']
+                final_dfc = dfc_over_time.iloc[-1]['days_forward_coverage']
+                min_dfc = dfc_over_time['days_forward_coverage'].min()
+                max_dfc = dfc_over_time['days_forward_coverage'].max()
                 
-            #     st.info(f"**DFC Trend Analysis for {selected_product}**:  \n"
-            #            f"- Started with {initial_dfc} days of coverage  \n"
-            #            f"- Ended with {final_dfc} days of coverage  \n"
-            #            f"- Minimum: {min_dfc} days, Maximum: {max_dfc} days  \n"
-            #            f"- {'⚠️ Product falls below critical threshold (7 days) at some point' if min_dfc < 7 else '✅ Product maintains healthy coverage throughout the period'}")
-            # else:
-            #     st.warning(f"No data available to calculate DFC over time for {selected_product}.")
+                st.info(f"**DFC Trend Analysis for {selected_product}**:  \n"
+                       f"- Started with {initial_dfc} days of coverage  \n"
+                       f"- Ended with {final_dfc} days of coverage  \n"
+                       f"- Minimum: {min_dfc} days, Maximum: {max_dfc} days  \n"
+                       f"- {'⚠️ Product falls below critical threshold (7 days) at some point' if min_dfc < 7 else '✅ Product maintains healthy coverage throughout the period'}")
+            else:
+                st.warning(f"No data available to calculate DFC over time for {selected_product}.")
 
         
         with col2:
@@ -474,9 +820,9 @@ else:
             
             # Create tabs for different views
             tab1, tab2 = st.tabs(["Top 10 Products", "Bottom 10 Products"])
+            top_products, bottom_products = top_bottom_coverage(st.session_state.coverage_df, n=10)
             
             with tab1:
-                top_products = st.session_state.coverage_df.nlargest(10, settings.COVERAGE_DAYS_FORWARD_COVERAGE)
                 fig = px.bar(
                     top_products,
                     x=settings.COVERAGE_PRODUCT_ID,
@@ -490,7 +836,6 @@ else:
             
             with tab2:
                 st.subheader("Bottom 10 Products by Days Forward Coverage")
-                bottom_products = st.session_state.coverage_df.nsmallest(10, settings.COVERAGE_DAYS_FORWARD_COVERAGE)
                 
                 # Format the table for better display
                 display_columns = [
@@ -521,7 +866,7 @@ else:
             
             # Products with critical coverage section (moved here for UI consistency)
             st.subheader("Products with Critical Coverage (< 7 days)")
-            critical_products = st.session_state.coverage_df[st.session_state.coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE] < 7].sort_values(settings.COVERAGE_DAYS_FORWARD_COVERAGE)
+            critical_products = critical_coverage(st.session_state.coverage_df, threshold=7)
             
             if critical_products.empty:
                 st.success("No products with critical coverage! All products have at least 7 days of coverage.")
@@ -562,7 +907,7 @@ else:
             st.subheader(f"Coverage Details for Selected Products")
             
             # Filter data for selected products
-            selected_coverage = st.session_state.coverage_df[st.session_state.coverage_df[settings.COVERAGE_PRODUCT_ID].isin(selected_products)]
+            selected_coverage = select_products(st.session_state.coverage_df, selected_products)
             
             # Bar chart for selected products
             fig = px.bar(
@@ -577,7 +922,7 @@ else:
             st.plotly_chart(fig, use_container_width=True)
             
             # Detailed table
-            st.dataframe(selected_coverage.sort_values(settings.COVERAGE_DAYS_FORWARD_COVERAGE, ascending=False), use_container_width=True)
+            st.dataframe(selected_coverage.sort_values(settings.COVERAGE_DAYS_FORWARD_COVERAGE, ascending=False), use_container_width=True, hide_index=True)
 
 # Footer
 st.markdown("---")
@@ -1,25 +1,24 @@
-import pandas as pd
 import numpy as np
 from datetime import datetime
-import os
 from helpers.config import get_settings, ManageDir
+from helpers.datasets import Datasets
 from helpers.dfc_algo import DFCAlgo
-from tqdm import tqdm
 
 def main():
     # Load datasets
     settings = get_settings()
     manage_dir = ManageDir()
+    datasets = Datasets()
     dfc_algo = DFCAlgo()
-    forecast_path = manage_dir.get_forecast_path()
-    inventory_path = manage_dir.get_inventory_path()
+    forecast_path = manage_dir.get_latest_forecast_path()
+    inventory_path = manage_dir.get_latest_inventory_path()
     
-    if not (os.path.exists(forecast_path) and os.path.exists(inventory_path)):
+    if forecast_path is None or inventory_path is None:
         print("Error: Dataset files not found. Please run generate_datasets.py first.")
         return
     
-    forecast_df = pd.read_csv(forecast_path)
-    inventory_df = pd.read_csv(inventory_path)
+    forecast_df = datasets.read_dataset(forecast_path, date_columns=[settings.FORCAST_DATE])
+    inventory_df = datasets.read_dataset(inventory_path, date_columns=[settings.INVENTORY_EXPIRY_DATE])
     
     # Calculate Days Forward Coverage
     coverage_df = dfc_algo.calculate_dfc(forecast_df, inventory_df, save_csv=True)
@@ -3,7 +3,6 @@ import numpy as np
 import random
 from datetime import datetime, timedelta
 import os
-from tqdm import tqdm
 from helpers.datasets import Datasets
 
 datasets = Datasets()
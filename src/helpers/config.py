@@ -1,4 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache
+from typing import Literal
 import os
 class Settings(BaseSettings):
     
@@ -16,6 +18,8 @@ class Settings(BaseSettings):
     BASE_INVENTORY_MAX: int
 
     DATA_DIR: str
+    DATASET_FORMAT: Literal['parquet', 'csv']
+    CACHE_DIR: str
 
     # Forcast dataset columns names
     FORCAST_FILE_NAME: str
@@ -36,9 +40,15 @@ class Settings(BaseSettings):
     COVERAGE_DAYS_FORWARD_COVERAGE: str
     COVERAGE_TOTAL_INVENTORY: str
 
+    # Dashboard summary file name
+    SUMMARY_FILE_NAME: str
+
     class Config:
         env_file = ".env"
+        # The settings object is shared by every caller of get_settings
+        frozen = True
         
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
     
@@ -47,9 +57,12 @@ class ManageDir:
         self.settings = get_settings()
         self.base_dir = os.path.dirname(os.path.dirname(__file__))
         self.data_dir = os.path.join(self.base_dir, self.settings.DATA_DIR)
+        self.cache_dir = os.path.join(self.base_dir, self.settings.CACHE_DIR)
         
         if not os.path.exists(self.data_dir):
             os.makedirs(self.data_dir)
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
 
     def get_forecast_path(self):
         return os.path.join(self.data_dir, self.settings.FORCAST_FILE_NAME)
@@ -58,4 +71,46 @@ class ManageDir:
         return os.path.join(self.data_dir, self.settings.INVENTORY_FILE_NAME)
 
     def get_coverage_path(self):
-        return os.path.join(self.data_dir, self.settings.COVERAGE_FILE_NAME)
\ No newline at end of file
+        return os.path.join(self.data_dir, self.settings.COVERAGE_FILE_NAME)
+
+    def get_summary_path(self):
+        return os.path.join(self.data_dir, self.settings.SUMMARY_FILE_NAME)
+
+    def get_forecast_parquet_path(self):
+        return os.path.splitext(self.get_forecast_path())[0] + '.parquet'
+
+    def get_inventory_parquet_path(self):
+        return os.path.splitext(self.get_inventory_path())[0] + '.parquet'
+
+    def get_coverage_parquet_path(self):
+        return os.path.splitext(self.get_coverage_path())[0] + '.parquet'
+
+    def get_latest_dataset_path(self, parquet_path, csv_path):
+        """Most recently written of a dataset's Parquet and CSV files, or None if neither exists."""
+        existing_paths = [path for path in (parquet_path, csv_path) if os.path.exists(path)]
+        if not existing_paths:
+            return None
+        return max(existing_paths, key=os.path.getmtime)
+
+    def get_latest_forecast_path(self):
+        return self.get_latest_dataset_path(self.get_forecast_parquet_path(), self.get_forecast_path())
+
+    def get_latest_inventory_path(self):
+        return self.get_latest_dataset_path(self.get_inventory_parquet_path(), self.get_inventory_path())
+
+    def get_latest_coverage_path(self):
+        return self.get_latest_dataset_path(self.get_coverage_parquet_path(), self.get_coverage_path())
+
+    def get_coverage_cache_path(self, fingerprint):
+        return os.path.join(self.cache_dir, f'dfc_{fingerprint}.parquet')
+
+    def prune_coverage_cache(self, keep):
+        """Delete all but the keep most recently used cached coverage files."""
+        cache_paths = sorted(
+            (os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+             if name.startswith('dfc_') and name.endswith('.parquet')),
+            key=os.path.getmtime,
+            reverse=True
+        )
+        for path in cache_paths[keep:]:
+            os.remove(path)
@@ -1,18 +1,19 @@
 import pandas as pd
 import numpy as np
-import random
-from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from datetime import datetime
 import os
-from tqdm import tqdm
 from .config import get_settings, Settings, ManageDir
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Random seed for reproducibility
+RANDOM_SEED = 42
 
 class Datasets:
     def __init__(self):
         self.settings = get_settings()
         self.manage_dir = ManageDir()
+        self.rng = np.random.default_rng(RANDOM_SEED)
     
     def generate_product_ids(self, num_products):
         """Generate unique product IDs."""
@@ -30,35 +31,33 @@ class Datasets:
         Returns:
             DataFrame with columns: product_id, date, forecasted_sales
         """
-        data = []
-    
-        for product_id in tqdm(product_ids, desc="Generating forecast dataset"):
-            # Base demand for this product (varies between products)
-            base_demand = np.random.randint(self.settings.BASE_DEMAND_MIN, self.settings.BASE_DEMAND_MAX)
+        num_products = len(product_ids)
         
-            # Variability factor for this product
-            variability = np.random.uniform(0.1, 0.5)
+        # Forecast dates as a native datetime64 array, shared by every product
+        dates = np.datetime64(start_date, 'D') + np.arange(num_days).astype('timedelta64[D]')
         
-            for day in range(num_days):
-                current_date = start_date + timedelta(days=day)
-            
-                # Add some randomness and weekly patterns, 3 = Thursday, 4 = Friday, 5 = Saturday
-                day_of_week_factor = 1.0 + (0.3 if current_date.weekday() in [3, 4, 5] else 0)  # Weekend boost
-                random_factor = np.random.normal(1.0, variability)
-            
-                # Ensure random_factor is positive and reasonable
-                random_factor = max(0.5, min(random_factor, 1.5))
-            
-                # Calculate forecasted quantity
-                forecasted_qty = round(base_demand * day_of_week_factor * random_factor)
-            
-                data.append({
-                    self.settings.FORCAST_PRODUCT_ID: product_id,
-                    self.settings.FORCAST_DATE: current_date.strftime('%Y-%m-%d'),
-                    self.settings.FORCAST_FORECASTED_SALES: forecasted_qty
-                })
+        # Add some randomness and weekly patterns, 3 = Thursday, 4 = Friday, 5 = Saturday
+        day_of_week_factor = np.where(np.isin(pd.DatetimeIndex(dates).weekday, [3, 4, 5]), 1.3, 1.0)  # Weekend boost
+        
+        # Base demand and variability factor per product (varies between products), one row per product
+        base_demand = self.rng.integers(self.settings.BASE_DEMAND_MIN, self.settings.BASE_DEMAND_MAX, size=num_products)[:, None]
+        variability = self.rng.uniform(0.1, 0.5, size=num_products)[:, None]
+        
+        # Ensure random_factor is positive and reasonable
+        random_factor = np.clip(self.rng.normal(1.0, variability, size=(num_products, num_days)), 0.5, 1.5)
+        
+        # Calculate forecasted quantity for every (product, day) at once
+        # Daily quantities are small, int32 halves the column size
+        forecasted_qty = np.rint(base_demand * day_of_week_factor * random_factor).astype(np.int32)
+        
+        # Rows are product-major: each product ID repeated over the date range
+        forecast_df = pd.DataFrame({
+            self.settings.FORCAST_PRODUCT_ID: np.repeat(product_ids, num_days),
+            self.settings.FORCAST_DATE: np.tile(dates, num_products).astype('datetime64[ns]'),
+            self.settings.FORCAST_FORECASTED_SALES: forecasted_qty.ravel()
+        })
     
-        return pd.DataFrame(data)
+        return forecast_df
 
     def generate_inventory_dataset(self, product_ids, start_date, end_date):
         """
@@ -70,40 +69,40 @@ class Datasets:
         Returns:
             DataFrame with columns: product_id, batch_id, expiry_date, inventory 
         """
-        data = []
+        num_products = len(product_ids)
         
-        for product_id in tqdm(product_ids, desc="Generating inventory dataset"):
-            # Determine number of batches for this product (at least MIN_BATCHES_PER_PRODUCT)
-            num_batches = random.randint(self.settings.MIN_BATCHES_PER_PRODUCT, self.settings.MAX_BATCHES_PER_PRODUCT)
-            
-            # Base inventory level for this product
-            base_inventory = np.random.randint(self.settings.BASE_INVENTORY_MIN, self.settings.BASE_INVENTORY_MAX)
-            
-            for batch_idx in range(num_batches):
-                # Generate a batch ID
-                batch_id = f"{product_id}_B{batch_idx + 1}"
-                
-                # Generate expiry date (within August 2024)
-                # Earlier batches tend to expire sooner (still random)
-                days_until_expiry = np.random.randint(
-                    1 + batch_idx,  
-                    (end_date - start_date).days + 1  # Maximum is August 31
-                )
-                expiry_date = end_date - timedelta(days=days_until_expiry)
-                
-                # Generate quantity for this batch
-                # Distribute the base inventory across batches with some randomness
-                quantity_factor = np.random.uniform(0.5, 1.5) / num_batches
-                inventory = max(1, int(base_inventory * quantity_factor))
-                
-                data.append({
-                    self.settings.INVENTORY_PRODUCT_ID: product_id,
-                    self.settings.INVENTORY_BATCH_ID: batch_id,
-                    self.settings.INVENTORY_EXPIRY_DATE: expiry_date.strftime('%Y-%m-%d'),
-                    self.settings.INVENTORY_INVENTORY: inventory
-                })
-        
-        return pd.DataFrame(data)
+        # Determine number of batches for each product (at least MIN_BATCHES_PER_PRODUCT)
+        num_batches = self.rng.integers(self.settings.MIN_BATCHES_PER_PRODUCT, self.settings.MAX_BATCHES_PER_PRODUCT + 1, size=num_products)
+        
+        # Base inventory level for each product
+        base_inventory = self.rng.integers(self.settings.BASE_INVENTORY_MIN, self.settings.BASE_INVENTORY_MAX, size=num_products)
+        
+        # One row per batch: owning product index and batch position within the product
+        product_idx = np.repeat(np.arange(num_products), num_batches)
+        batch_idx = np.arange(num_batches.sum()) - np.repeat(np.cumsum(num_batches) - num_batches, num_batches)
+        
+        # Generate batch IDs
+        batch_product_ids = np.asarray(product_ids)[product_idx]
+        batch_ids = [f"{product_id}_B{idx + 1}" for product_id, idx in zip(batch_product_ids, batch_idx)]
+        
+        # Generate expiry dates (within August 2024)
+        # Earlier batches tend to expire sooner (still random), maximum is August 31
+        days_until_expiry = self.rng.integers(1 + batch_idx, (end_date - start_date).days + 1)
+        expiry_dates = np.datetime64(end_date, 'D') - days_until_expiry.astype('timedelta64[D]')
+        
+        # Generate quantity for each batch
+        # Distribute the base inventory across batches with some randomness
+        quantity_factor = self.rng.uniform(0.5, 1.5, size=len(batch_idx)) / num_batches[product_idx]
+        inventory = np.maximum(1, (base_inventory[product_idx] * quantity_factor).astype(np.int32))
+        
+        inventory_df = pd.DataFrame({
+            self.settings.INVENTORY_PRODUCT_ID: batch_product_ids,
+            self.settings.INVENTORY_BATCH_ID: batch_ids,
+            self.settings.INVENTORY_EXPIRY_DATE: expiry_dates.astype('datetime64[ns]'),
+            self.settings.INVENTORY_INVENTORY: inventory
+        })
+        
+        return inventory_df
 
     def generate_datasets(self):
         """Generate forecast and inventory datasets."""
@@ -120,12 +119,22 @@ class Datasets:
         # Generate inventory dataset
         inventory_df = self.generate_inventory_dataset(product_ids, start_date, end_date)
         
-        # Save datasets to CSV files
-        forecast_df.to_csv(self.manage_dir.get_forecast_path(), index=False)
-        print(f"Generated forecast data for {len(product_ids)} products over {self.settings.FORECAST_DAYS} days") 
-        
-        inventory_df.to_csv(self.manage_dir.get_inventory_path(), index=False)
-        print(f"Generated inventory data with {len(inventory_df)} batches")
+        # Save datasets in the configured format
+        forecast_path = self.save_dataset(
+            forecast_df,
+            self.manage_dir.get_forecast_path(),
+            self.manage_dir.get_forecast_parquet_path(),
+            date_columns=[self.settings.FORCAST_DATE]
+        )
+        print(f"Generated forecast data for {len(product_ids)} products over {self.settings.FORECAST_DAYS} days in {forecast_path}")
+        
+        inventory_path = self.save_dataset(
+            inventory_df,
+            self.manage_dir.get_inventory_path(),
+            self.manage_dir.get_inventory_parquet_path(),
+            date_columns=[self.settings.INVENTORY_EXPIRY_DATE]
+        )
+        print(f"Generated inventory data with {len(inventory_df)} batches in {inventory_path}")
         
         # Display sample of each dataset
         print("\nSample forecast data:")
@@ -137,28 +146,86 @@ class Datasets:
         # Verify constraints
         self.verify_datasets(forecast_df, inventory_df, product_ids)
 
+    def save_parquet(self, df, path):
+        """Save a dataset as zstd-compressed Parquet."""
+        df.to_parquet(path, engine='pyarrow', compression='zstd', index=False)
+
+    def save_dataset(self, df, csv_path, parquet_path, date_columns=()):
+        """
+        Save a dataset in the configured DATASET_FORMAT.
+        
+        Args:
+            df: DataFrame to save
+            csv_path: Destination when DATASET_FORMAT is 'csv'
+            parquet_path: Destination when DATASET_FORMAT is 'parquet'
+            date_columns: Datetime columns, stored as millisecond timestamps in Parquet and YYYY-MM-DD in CSV
+            
+        Returns:
+            Path of the written file
+        """
+        df = df.astype({column: 'datetime64[ms]' for column in date_columns})
+        if self.settings.DATASET_FORMAT == 'parquet':
+            self.save_parquet(df, parquet_path)
+            return parquet_path
+        
+        # Arrow's CSV writer formats the columns in C rather than row by row in Python
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        for column in date_columns:
+            table = table.set_column(table.schema.get_field_index(column), column, pc.cast(table[column], pa.date32(), safe=False))
+        pa_csv.write_csv(table, csv_path)
+        return csv_path
+
+    def read_dataset(self, path, schema=None, date_columns=()):
+        """
+        Read a dataset written as Parquet or CSV, picked by the file extension.
+        
+        Args:
+            path: Parquet or CSV file to read
+            schema: Optional Arrow schema; only its columns are read, and CSV columns get its types without inference
+            date_columns: CSV columns to parse as dates when no schema is given
+            
+        Returns:
+            DataFrame
+        """
+        if path.endswith('.parquet'):
+            return pd.read_parquet(path, engine='pyarrow', columns=schema.names if schema is not None else None)
+        
+        if schema is not None:
+            # Multithreaded Arrow CSV reader given the known column types, so there is no type inference pass
+            convert_options = pa_csv.ConvertOptions(column_types=schema, include_columns=schema.names)
+            return pa_csv.read_csv(path, convert_options=convert_options).to_pandas()
+        return pd.read_csv(path, engine='pyarrow', parse_dates=list(date_columns))
+
     def verify_datasets(self, forecast_df, inventory_df, product_ids):
         """Verify that the generated datasets meet all requirements."""
+        # Column names, looked up once per call
+        forecast_product_col = self.settings.FORCAST_PRODUCT_ID
+        forecast_date_col = self.settings.FORCAST_DATE
+        inventory_product_col = self.settings.INVENTORY_PRODUCT_ID
+        expiry_date_col = self.settings.INVENTORY_EXPIRY_DATE
+        
         print("\nVerifying datasets...")
         
-        # Check forecast date range
-        min_date = pd.to_datetime(forecast_df[self.settings.FORCAST_DATE]).min()
-        max_date = pd.to_datetime(forecast_df[self.settings.FORCAST_DATE]).max()
+        # Check forecast date range (each date column is parsed once, a no-op for datetime64 columns)
+        forecast_dates = pd.to_datetime(forecast_df[forecast_date_col])
+        min_date, max_date = forecast_dates.min(), forecast_dates.max()
         print(f"Forecast date range: {min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}")
         
         # Check inventory expiry dates
-        min_expiry = pd.to_datetime(inventory_df[self.settings.INVENTORY_EXPIRY_DATE]).min()
-        max_expiry = pd.to_datetime(inventory_df[self.settings.INVENTORY_EXPIRY_DATE]).max()
+        expiry_dates = pd.to_datetime(inventory_df[expiry_date_col])
+        min_expiry, max_expiry = expiry_dates.min(), expiry_dates.max()
         print(f"Inventory expiry date range: {min_expiry.strftime('%Y-%m-%d')} to {max_expiry.strftime('%Y-%m-%d')}")
         
-        # Check batches per product
-        batches_per_product = inventory_df.groupby(self.settings.INVENTORY_PRODUCT_ID).size()
-        min_batches = batches_per_product.min()
+        # Check batches per product: the generated inventory is product-major, so each product's batches
+        # are one run of rows and the run lengths are the batch counts
+        inventory_products = inventory_df[inventory_product_col].to_numpy()
+        boundaries = np.r_[0, np.flatnonzero(inventory_products[1:] != inventory_products[:-1]) + 1, len(inventory_products)]
+        min_batches = np.diff(boundaries).min()
         print(f"Minimum batches per product: {min_batches}")
         
         # Check if all products have forecast and inventory
-        products_with_forecast = forecast_df[self.settings.FORCAST_PRODUCT_ID].unique()
-        products_with_inventory = inventory_df[self.settings.INVENTORY_PRODUCT_ID].unique()
+        products_with_forecast = forecast_df[forecast_product_col].unique()
+        products_with_inventory = inventory_df[inventory_product_col].unique()
         
         missing_forecast = set(product_ids) - set(products_with_forecast)
         missing_inventory = set(product_ids) - set(products_with_inventory)
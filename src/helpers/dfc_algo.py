@@ -1,88 +1,224 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 import os
-from tqdm import tqdm
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from .config import get_settings, ManageDir
 
-class DFCAlgo:
-    def __init__(self):
-        self.settings = get_settings()
-        self.manage_dir = ManageDir()
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Without Numba the kernels run as plain Python functions
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        return lambda func: func
+    
+    prange = range
+
+# Version of the coverage results; bump it whenever calculate_dfc output changes, so stored results are recomputed
+DFC_ALGO_VERSION = 2
+
+def _date_values(dates):
+    """Convert a date, or a column of dates, to int64 nanoseconds for the kernels."""
+    if np.ndim(dates) == 0:
+        return pd.Timestamp(dates).to_datetime64().astype('datetime64[ns]').view(np.int64)
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        # Only string or object columns need parsing; datetime64 columns of any unit are used as is
+        dates = pd.to_datetime(dates)
+    return np.asarray(dates, dtype='datetime64[ns]').view(np.int64)
+
+def _code_dtype(num_products):
+    """Narrowest signed integer dtype for product codes 0..num_products-1."""
+    return np.int16 if num_products <= np.iinfo(np.int16).max else np.int32
+
+def _product_codes(forecast_products, inventory_products):
+    """
+    Integer codes for the product IDs of the forecast and inventory rows.
+    
+    Returns:
+        tuple: (product_ids, forecast_codes, inventory_codes), codes index into the sorted product_ids
+            and are -1 for missing product IDs
+    """
+    if (isinstance(forecast_products.dtype, pd.CategoricalDtype)
+            and forecast_products.dtype == inventory_products.dtype
+            and forecast_products.cat.categories.is_monotonic_increasing):
+        # Both columns share a sorted categorical dtype, so its codes can be used as they are
+        return (
+            forecast_products.cat.categories.to_numpy(),
+            forecast_products.cat.codes.to_numpy(),
+            inventory_products.cat.codes.to_numpy()
+        )
+    
+    # Hash the IDs of both datasets in one pass; sort=True numbers them in product ID order
+    codes, product_ids = pd.factorize(np.concatenate([forecast_products.to_numpy(), inventory_products.to_numpy()]), sort=True)
+    codes = codes.astype(_code_dtype(len(product_ids)))
+    return np.asarray(product_ids), codes[:len(forecast_products)], codes[len(forecast_products):]
+
+def _quantity_values(*quantities):
+    """
+    Cast quantity columns to one kernel dtype: float64 when any column is fractional,
+    otherwise int32 when every column fits in it and int64 when not.
+    """
+    dtype = np.result_type(*(q.dtype for q in quantities))
+    if np.issubdtype(dtype, np.floating):
+        dtype = np.float64
+    elif np.can_cast(dtype, np.int32):
+        dtype = np.int32
+    else:
+        dtype = np.int64
+    return tuple(np.asarray(q, dtype=dtype) for q in quantities)
+
+# Compiled eagerly for integer and fractional quantities; dates are always int64 nanoseconds
+# and totals are accumulated in 64 bits
+@njit([
+    'UniTuple(int64, 2)(int64[:], int32[:], int64[:], int32[:])',
+    'UniTuple(int64, 2)(int64[:], int64[:], int64[:], int64[:])',
+    'Tuple((int64, float64))(int64[:], float64[:], int64[:], float64[:])',
+], cache=True)
+def _days_covered_kernel(forecast_dates, daily_demand, expiry_dates, batch_quantity):
+    """
+    FIFO days forward coverage for a single product.
+    
+    Args:
+        forecast_dates (ndarray): Forecast dates as int64, sorted ascending
+        daily_demand (ndarray): Forecasted sales aligned with forecast_dates
+        expiry_dates (ndarray): Batch expiry dates as int64, sorted ascending
+        batch_quantity (ndarray): Batch quantities aligned with expiry_dates
+        
+    Returns:
+        tuple: (days_covered, total_inventory)
+    """
+    total_inventory = batch_quantity.sum()
+    if len(forecast_dates) == 0 or len(batch_quantity) == 0:
+        return 0, total_inventory
+    
+    quantity = batch_quantity.copy()
+    remaining_inventory = total_inventory
+    days_covered = 0
+    
+    # A running total is exact for integer quantities but drifts with fractional ones,
+    # so those are re-summed from the batches left each day
+    fractional = isinstance(total_inventory, float)
+    
+    # Index of the earliest batch that has not expired or been consumed yet
+    j = 0
     
-    def _calculate_days_covered(self, product_forecast, product_inventory, start_date=None):
+    for d in range(len(forecast_dates)):
+        # Remove expired inventory for this date
+        while j < len(quantity) and expiry_dates[j] < forecast_dates[d]:
+            remaining_inventory -= quantity[j]
+            quantity[j] = 0
+            j += 1
+        
+        if fractional:
+            remaining_inventory = quantity[j:].sum()
+        
+        demand_to_fulfill = daily_demand[d]
+        if remaining_inventory < demand_to_fulfill:
+            # Not enough inventory to cover demand, stop counting
+            break
+        
+        days_covered += 1
+        remaining_inventory -= demand_to_fulfill
+        
+        # Update inventory (FIFO consumption)
+        while demand_to_fulfill > 0 and j < len(quantity):
+            if quantity[j] >= demand_to_fulfill:
+                quantity[j] -= demand_to_fulfill
+                demand_to_fulfill = 0
+            else:
+                demand_to_fulfill -= quantity[j]
+                quantity[j] = 0
+                j += 1
+    
+    return days_covered, total_inventory
+
+# FIFO kernel the multi-product and over-time kernels call for each simulation
+if NUMBA_AVAILABLE:
+    _product_kernel = _days_covered_kernel
+else:
+    try:
+        # Ahead-of-time compiled FIFO kernel, built with setup_kernels.py; it releases the GIL,
+        # so the thread pool below runs products truly in parallel
+        from ._dfc_kernel import days_covered as _product_kernel
+    except ImportError:
+        _product_kernel = _days_covered_kernel
+
+# Streamlit runs each session's script in its own thread, and Numba's fallback workqueue
+# threading layer must not be entered from two threads at once
+_parallel_kernel_lock = threading.Lock()
+
+if NUMBA_AVAILABLE:
+    @njit([
+        'void(int64[:], int64[:], int32[:], int64[:], int64[:], int32[:], int64[:], int64[:])',
+        'void(int64[:], int64[:], int64[:], int64[:], int64[:], int64[:], int64[:], int64[:])',
+        'void(int64[:], int64[:], float64[:], int64[:], int64[:], float64[:], int64[:], float64[:])',
+    ], parallel=True, cache=True)
+    def _dfc_kernel(forecast_offsets, forecast_dates, daily_demand, inventory_offsets, expiry_dates, batch_quantity, out_dfc, out_total_inventory):
         """
-        Helper method to calculate days forward coverage for a specific product.
+        Days forward coverage for every product in parallel.
         
-        Args:
-            product_forecast (DataFrame): Forecast data for a specific product
-            product_inventory (DataFrame): Inventory data for a specific product
-            start_date (datetime, optional): The reference date for calculation
-            
-        Returns:
-            tuple: (days_covered, total_inventory)
+        Forecast and inventory arrays are grouped by product; rows of product p are
+        forecast_offsets[p]:forecast_offsets[p + 1] (same for inventory_offsets).
+        Results are written to out_dfc[p] and out_total_inventory[p].
         """
-        # Make copies to avoid modifying the original data
-        product_forecast = product_forecast.copy()
-        product_inventory = product_inventory.copy()
-        
-        # Filter by start date if provided
-        if start_date is not None:
-            product_forecast = product_forecast[product_forecast[self.settings.FORCAST_DATE] >= start_date]
-            product_inventory = product_inventory[product_inventory[self.settings.INVENTORY_EXPIRY_DATE] >= start_date]
-        
-        # Sort inventory by expiry date (FIFO - First In, First Out)
-        product_inventory = product_inventory.sort_values(self.settings.INVENTORY_EXPIRY_DATE)
-        
-        # Sort forecast by date
-        product_forecast = product_forecast.sort_values(self.settings.FORCAST_DATE)
-        
-        # Calculate total inventory
-        total_inventory = product_inventory[self.settings.INVENTORY_INVENTORY].sum()
-        
-        # If no inventory or no forecast, return 0 days covered
-        if product_inventory.empty or product_forecast.empty:
-            return 0, total_inventory
-        
-        # Calculate days forward coverage
-        days_covered = 0
-        remaining_inventory = total_inventory
-        
-        for _, forecast_row in product_forecast.iterrows():
-            forecast_date = forecast_row[self.settings.FORCAST_DATE]
-            daily_demand = forecast_row[self.settings.FORCAST_FORECASTED_SALES]
-            
-            # Remove expired inventory for this date
-            product_inventory = product_inventory[product_inventory[self.settings.INVENTORY_EXPIRY_DATE] >= forecast_date]
-            
-            # Recalculate remaining inventory after removing expired items
-            if product_inventory.empty:
-                remaining_inventory = 0
-            else:
-                remaining_inventory = product_inventory[self.settings.INVENTORY_INVENTORY].sum()
-            
-            # If we have enough inventory to cover this day's demand
-            if remaining_inventory >= daily_demand:
-                days_covered += 1
-                
-                # Update inventory (FIFO consumption)
-                demand_to_fulfill = daily_demand
-                
-                for idx, inv_row in product_inventory.iterrows():
-                    batch_quantity = inv_row[self.settings.INVENTORY_INVENTORY]
-                    
-                    if batch_quantity >= demand_to_fulfill:
-                        # This batch can fulfill all remaining demand
-                        product_inventory.at[idx, self.settings.INVENTORY_INVENTORY] = batch_quantity - demand_to_fulfill
-                        break
-                    else:
-                        # This batch is fully consumed, move to next
-                        demand_to_fulfill -= batch_quantity
-                        product_inventory.at[idx, self.settings.INVENTORY_INVENTORY] = 0
-            else:
-                # Not enough inventory to cover demand, stop counting
-                break
+        for p in prange(len(out_dfc)):
+            f_start, f_end = forecast_offsets[p], forecast_offsets[p + 1]
+            i_start, i_end = inventory_offsets[p], inventory_offsets[p + 1]
+            out_dfc[p], out_total_inventory[p] = _product_kernel(
+                forecast_dates[f_start:f_end],
+                daily_demand[f_start:f_end],
+                expiry_dates[i_start:i_end],
+                batch_quantity[i_start:i_end]
+            )
+else:
+    def _dfc_kernel(forecast_offsets, forecast_dates, daily_demand, inventory_offsets, expiry_dates, batch_quantity, out_dfc, out_total_inventory):
+        """Thread pool version of _dfc_kernel for when Numba is not installed, same arguments and results."""
+        def compute_one(p):
+            f_start, f_end = forecast_offsets[p], forecast_offsets[p + 1]
+            i_start, i_end = inventory_offsets[p], inventory_offsets[p + 1]
+            return _product_kernel(
+                forecast_dates[f_start:f_end],
+                daily_demand[f_start:f_end],
+                expiry_dates[i_start:i_end],
+                batch_quantity[i_start:i_end]
+            )
         
-        return days_covered, total_inventory
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for p, (days_covered, total_inventory) in enumerate(executor.map(compute_one, range(len(out_dfc)))):
+                out_dfc[p], out_total_inventory[p] = days_covered, total_inventory
+
+@njit([
+    'void(int64[:], int32[:], int64[:], int32[:], int64[:], int64[:], int64[:])',
+    'void(int64[:], int64[:], int64[:], int64[:], int64[:], int64[:], int64[:])',
+    'void(int64[:], float64[:], int64[:], float64[:], int64[:], int64[:], float64[:])',
+], parallel=True, cache=True)
+def _dfc_over_time_kernel(forecast_dates, daily_demand, expiry_dates, batch_quantity, start_dates, out_dfc, out_total_inventory):
+    """
+    Days forward coverage of one product for every start date in parallel.
+    
+    Forecast rows are sorted by date and batches by expiry date. Start date d uses the
+    forecast from start_dates[d] on and the batches that have not expired by then, at
+    their full quantities, so every start date is an independent FIFO simulation.
+    Results are written to out_dfc[d] and out_total_inventory[d].
+    """
+    for d in prange(len(start_dates)):
+        f_start = np.searchsorted(forecast_dates, start_dates[d])
+        i_start = np.searchsorted(expiry_dates, start_dates[d])
+        out_dfc[d], out_total_inventory[d] = _product_kernel(
+            forecast_dates[f_start:],
+            daily_demand[f_start:],
+            expiry_dates[i_start:],
+            batch_quantity[i_start:]
+        )
+
+class DFCAlgo:
+    def __init__(self):
+        self.settings = get_settings()
+        self.manage_dir = ManageDir()
     
     def calculate_dfc(self, forecast_df, inventory_df, current_date=None, save_csv=True):
         """
@@ -108,71 +244,107 @@ class DFCAlgo:
                 - COVERAGE_PRODUCT_ID: Unique identifier for each product
                 - COVERAGE_DAYS_FORWARD_COVERAGE: Number of days the current inventory can cover
         """        
+        # Column names, looked up once per call
+        forecast_product_col = self.settings.FORCAST_PRODUCT_ID
+        forecast_date_col = self.settings.FORCAST_DATE
+        forecast_sales_col = self.settings.FORCAST_FORECASTED_SALES
+        inventory_product_col = self.settings.INVENTORY_PRODUCT_ID
+        expiry_date_col = self.settings.INVENTORY_EXPIRY_DATE
+        inventory_col = self.settings.INVENTORY_INVENTORY
+        coverage_product_col = self.settings.COVERAGE_PRODUCT_ID
+        coverage_dfc_col = self.settings.COVERAGE_DAYS_FORWARD_COVERAGE
+        coverage_total_col = self.settings.COVERAGE_TOTAL_INVENTORY
         
         # Convert date columns to datetime
-        forecast_df = forecast_df.copy()
-        inventory_df = inventory_df.copy()
-        
-        forecast_df[self.settings.FORCAST_DATE] = pd.to_datetime(forecast_df[self.settings.FORCAST_DATE])
-        inventory_df[self.settings.INVENTORY_EXPIRY_DATE] = pd.to_datetime(inventory_df[self.settings.INVENTORY_EXPIRY_DATE])
+        forecast_dates = _date_values(forecast_df[forecast_date_col])
+        expiry_dates = _date_values(inventory_df[expiry_date_col])
         
         # If current_date is not provided, use the earliest date in the forecast
         if current_date is None:
-            current_date = forecast_df[self.settings.FORCAST_DATE].min()
+            if len(forecast_dates) == 0:
+                # No forecast, so there is no earliest date and no product to cover
+                return pd.DataFrame(columns=[coverage_product_col, coverage_dfc_col, coverage_total_col])
+            current_date = forecast_dates.min()
         else:
-            current_date = pd.to_datetime(current_date)
-        
-        # Filter out expired inventory
-        valid_inventory = inventory_df[inventory_df[self.settings.INVENTORY_EXPIRY_DATE] >= current_date].copy()
-        
-        # Filter future forecast dates
-        future_forecast = forecast_df[forecast_df[self.settings.FORCAST_DATE] >= current_date].copy()
-        
-        # Sort forecast by date
-        future_forecast = future_forecast.sort_values([self.settings.FORCAST_PRODUCT_ID, self.settings.FORCAST_DATE])
-        
-        # Get unique product IDs from both datasets
-        all_products = set(future_forecast[self.settings.FORCAST_PRODUCT_ID].unique()) | set(valid_inventory[self.settings.INVENTORY_PRODUCT_ID].unique())
-        
-        results = []
-        
-        for product_id in tqdm(all_products, desc="Calculating Days Forward Coverage"):
-            # Get product forecast
-            product_forecast = future_forecast[future_forecast[self.settings.FORCAST_PRODUCT_ID] == product_id].copy()
-            
-            if product_forecast.empty:
-                # No forecast for this product, can't calculate coverage
-                results.append({
-                    self.settings.COVERAGE_PRODUCT_ID: product_id,
-                    self.settings.COVERAGE_DAYS_FORWARD_COVERAGE: 0,
-                    self.settings.COVERAGE_TOTAL_INVENTORY: 0,
-                    'has_forecast': False
-                })
-                continue
-            
-            # Get product inventory
-            product_inventory = valid_inventory[valid_inventory[self.settings.INVENTORY_PRODUCT_ID] == product_id].copy()
-            
-            if product_inventory.empty:
-                # No inventory for this product
-                results.append({
-                    self.settings.COVERAGE_PRODUCT_ID: product_id,
-                    self.settings.COVERAGE_DAYS_FORWARD_COVERAGE: 0,
-                    self.settings.COVERAGE_TOTAL_INVENTORY: 0,
-                    'has_forecast': True
-                })
-                continue
-            
-            # Use the helper method to calculate days covered and total inventory
-            days_covered, total_inventory = self._calculate_days_covered(
-                product_forecast, product_inventory
+            current_date = _date_values(current_date)
+        
+        # Filter out expired inventory and past forecast dates
+        future_forecast = forecast_dates >= current_date
+        valid_inventory = expiry_dates >= current_date
+        
+        product_ids, forecast_codes, inventory_codes = _product_codes(
+            forecast_df[forecast_product_col],
+            inventory_df[inventory_product_col]
+        )
+        
+        # Rows without a product ID have code -1; they can't be matched to each other,
+        # so they are left out of the kernel and reported as one uncovered product
+        has_missing_product = bool((forecast_codes[future_forecast] < 0).any() or (inventory_codes[valid_inventory] < 0).any())
+        future_forecast &= forecast_codes >= 0
+        valid_inventory &= inventory_codes >= 0
+        
+        forecast_codes = forecast_codes[future_forecast]
+        forecast_dates = forecast_dates[future_forecast]
+        daily_demand = forecast_df[forecast_sales_col].to_numpy()[future_forecast]
+        
+        inventory_codes = inventory_codes[valid_inventory]
+        expiry_dates = expiry_dates[valid_inventory]
+        batch_quantity = inventory_df[inventory_col].to_numpy()[valid_inventory]
+        daily_demand, batch_quantity = _quantity_values(daily_demand, batch_quantity)
+        
+        # Get unique products from both datasets, renumbered 0..P-1 in product ID order
+        used_codes = np.union1d(forecast_codes, inventory_codes)
+        all_products = product_ids[used_codes]
+        forecast_codes = np.searchsorted(used_codes, forecast_codes).astype(_code_dtype(len(used_codes)))
+        inventory_codes = np.searchsorted(used_codes, inventory_codes).astype(_code_dtype(len(used_codes)))
+        
+        # Group rows by product: sort by (product, date) and (product, expiry)
+        forecast_order = np.lexsort((forecast_dates, forecast_codes))
+        inventory_order = np.lexsort((expiry_dates, inventory_codes))
+        
+        # Row offsets of each product in the sorted arrays: running totals of the per-product row counts
+        forecast_offsets = np.zeros(len(all_products) + 1, dtype=np.int64)
+        inventory_offsets = np.zeros(len(all_products) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(forecast_codes, minlength=len(all_products)), out=forecast_offsets[1:])
+        np.cumsum(np.bincount(inventory_codes, minlength=len(all_products)), out=inventory_offsets[1:])
+        
+        out_dfc = np.zeros(len(all_products), dtype=np.int64)
+        # Totals are sums of batches, so keep at least 64-bit even for narrow quantity columns
+        out_total_inventory = np.zeros(len(all_products), dtype=np.result_type(batch_quantity.dtype, np.int64))
+        
+        with _parallel_kernel_lock:
+            _dfc_kernel(
+                forecast_offsets,
+                forecast_dates[forecast_order],
+                daily_demand[forecast_order],
+                inventory_offsets,
+                expiry_dates[inventory_order],
+                batch_quantity[inventory_order],
+                out_dfc,
+                out_total_inventory
             )
-            
-            results.append({
-                self.settings.COVERAGE_PRODUCT_ID: product_id,
-                self.settings.COVERAGE_DAYS_FORWARD_COVERAGE: days_covered,
-                self.settings.COVERAGE_TOTAL_INVENTORY: total_inventory
-            }) 
+        
+        # Products without forecast or without inventory can't be covered
+        has_forecast = np.diff(forecast_offsets) > 0
+        has_inventory = np.diff(inventory_offsets) > 0
+        incomplete = ~(has_forecast & has_inventory)
+        out_dfc[incomplete] = 0
+        out_total_inventory[incomplete] = 0
+        
+        if has_missing_product:
+            all_products = np.append(all_products, None)
+            out_dfc = np.append(out_dfc, 0)
+            out_total_inventory = np.append(out_total_inventory, 0)
+            has_forecast = np.append(has_forecast, False)
+            incomplete = np.append(incomplete, True)
+        
+        results = {
+            coverage_product_col: all_products,
+            coverage_dfc_col: out_dfc,
+            coverage_total_col: out_total_inventory
+        }
+        if incomplete.any():
+            results['has_forecast'] = pd.Series(has_forecast, dtype=object).where(incomplete)
         
         coverage_df = pd.DataFrame(results)
         
@@ -183,35 +355,56 @@ class DFCAlgo:
         return coverage_df
 
     def calculate_dfc_over_time(self, forecast_df, inventory_df, product_id):
-        """Calculate how Days Forward Coverage changes day by day for a specific product."""
+        """Calculate how Days Forward Coverage changes day by day for a specific product. The input frames are only read."""
+        # Column names, looked up once per call
+        forecast_product_col = self.settings.FORCAST_PRODUCT_ID
+        forecast_date_col = self.settings.FORCAST_DATE
+        forecast_sales_col = self.settings.FORCAST_FORECASTED_SALES
+        inventory_product_col = self.settings.INVENTORY_PRODUCT_ID
+        expiry_date_col = self.settings.INVENTORY_EXPIRY_DATE
+        inventory_col = self.settings.INVENTORY_INVENTORY
+        
         # Filter data for the specific product
-        product_forecast = forecast_df[forecast_df[self.settings.FORCAST_PRODUCT_ID] == product_id].copy()
-        product_inventory = inventory_df[inventory_df[self.settings.INVENTORY_PRODUCT_ID] == product_id].copy()
+        product_forecast = forecast_df[forecast_df[forecast_product_col] == product_id]
+        product_inventory = inventory_df[inventory_df[inventory_product_col] == product_id]
         
         if product_forecast.empty or product_inventory.empty:
             return pd.DataFrame()
         
-        # Sort forecast by date
-        product_forecast = product_forecast.sort_values(self.settings.FORCAST_DATE)
+        forecast_dates = _date_values(product_forecast[forecast_date_col])
+        expiry_dates = _date_values(product_inventory[expiry_date_col])
+        daily_demand, batch_quantity = _quantity_values(
+            product_forecast[forecast_sales_col].to_numpy(),
+            product_inventory[inventory_col].to_numpy()
+        )
+        
+        # Sort forecast by date and inventory by expiry date (FIFO - First In, First Out), once for all dates
+        forecast_order = np.argsort(forecast_dates, kind='stable')
+        inventory_order = np.argsort(expiry_dates, kind='stable')
+        forecast_dates, daily_demand = forecast_dates[forecast_order], daily_demand[forecast_order]
+        expiry_dates, batch_quantity = expiry_dates[inventory_order], batch_quantity[inventory_order]
         
         # Get all dates in the forecast
-        dates = product_forecast[self.settings.FORCAST_DATE].unique()
+        dates = product_forecast[forecast_date_col].iloc[forecast_order].unique()
         
-        results = []
+        days_forward_coverage = np.zeros(len(dates), dtype=np.int64)
+        # Totals are sums of batches, so keep at least 64-bit even for narrow quantity columns
+        total_inventory = np.zeros(len(dates), dtype=np.result_type(batch_quantity.dtype, np.int64))
         
-        # For each date, calculate DFC as if that date was the current date
-        for current_date in dates:
-            # Filter inventory and forecast for this date using the helper method
-            days_covered, total_inventory = self._calculate_days_covered(
-                product_forecast, 
-                product_inventory,
-                start_date=current_date
+        # For each date, calculate DFC as if that date was the current date, all in one kernel call
+        with _parallel_kernel_lock:
+            _dfc_over_time_kernel(
+                forecast_dates,
+                daily_demand,
+                expiry_dates,
+                batch_quantity,
+                _date_values(dates),
+                days_forward_coverage,
+                total_inventory
             )
-            
-            results.append({
-                'date': current_date,
-                'days_forward_coverage': days_covered,
-                'total_inventory': total_inventory
-            })
-        
-        return pd.DataFrame(results)
+        
+        return pd.DataFrame({
+            'date': dates,
+            'days_forward_coverage': days_forward_coverage,
+            'total_inventory': total_inventory
+        })
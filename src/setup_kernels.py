@@ -0,0 +1,15 @@
+"""
+Build the optional Cython DFC kernel in place, for environments without Numba:
+
+    pip install cython
+    python setup_kernels.py build_ext --inplace
+"""
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+setup(
+    name="dfc-kernels",
+    ext_modules=cythonize(
+        [Extension("helpers._dfc_kernel", ["helpers/_dfc_kernel.pyx"])]
+    ),
+)
@@ -0,0 +1,16 @@
+import os
+
+from helpers.config import ManageDir
+
+def test_prune_coverage_cache_keeps_the_most_recently_used_files(tmp_path):
+    manage_dir = ManageDir()
+    manage_dir.cache_dir = str(tmp_path)
+    for i, fingerprint in enumerate(['a', 'b', 'c']):
+        path = manage_dir.get_coverage_cache_path(fingerprint)
+        open(path, 'w').close()
+        os.utime(path, (i, i))
+    open(tmp_path / 'other.txt', 'w').close()
+
+    manage_dir.prune_coverage_cache(keep=2)
+
+    assert sorted(os.listdir(tmp_path)) == ['dfc_b.parquet', 'dfc_c.parquet', 'other.txt']
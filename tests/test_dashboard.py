@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+import dashboard
+from dashboard import settings
+
+def test_categorize_product_ids_keeps_missing_ids_as_nan():
+    forecast_df = pd.DataFrame({settings.FORCAST_PRODUCT_ID: ['B', None, 'A']})
+    inventory_df = pd.DataFrame({settings.INVENTORY_PRODUCT_ID: ['A', np.nan]})
+    coverage_df = pd.DataFrame({settings.COVERAGE_PRODUCT_ID: ['A', 'B', None]})
+
+    forecast_df, inventory_df, coverage_df = dashboard.categorize_product_ids(forecast_df, inventory_df, coverage_df)
+
+    assert list(forecast_df[settings.FORCAST_PRODUCT_ID].cat.categories) == ['A', 'B']
+    assert forecast_df[settings.FORCAST_PRODUCT_ID].cat.codes.tolist() == [1, -1, 0]
+    assert inventory_df[settings.INVENTORY_PRODUCT_ID].cat.codes.tolist() == [0, -1]
+    assert coverage_df[settings.COVERAGE_PRODUCT_ID].cat.codes.tolist() == [0, 1, -1]
+
+def test_categorize_product_ids_with_only_coverage():
+    coverage_df = pd.DataFrame({settings.COVERAGE_PRODUCT_ID: ['A', None]})
+
+    _, _, coverage_df = dashboard.categorize_product_ids(None, None, coverage_df)
+
+    assert list(coverage_df[settings.COVERAGE_PRODUCT_ID].cat.categories) == ['A']
+    assert coverage_df[settings.COVERAGE_PRODUCT_ID].isna().tolist() == [False, True]
+
+def test_csv_datasets_with_fractional_quantities(tmp_path):
+    path = str(tmp_path / 'inventory.csv')
+    pd.DataFrame({
+        settings.INVENTORY_PRODUCT_ID: ['A', 'A', 'B'],
+        settings.INVENTORY_BATCH_ID: ['A_B1', 'A_B2', 'B_B1'],
+        settings.INVENTORY_EXPIRY_DATE: ['2024-08-10', '2024-08-20', '2024-08-10'],
+        settings.INVENTORY_INVENTORY: [3.5, 2.0, 4.0],
+    }).to_csv(path, index=False)
+
+    inventory_df = dashboard.datasets.read_dataset(path, dashboard.dataset_schemas()['inventory'])
+    product_rows = dashboard.read_product_rows(path, 'inventory', settings.INVENTORY_PRODUCT_ID, 'A')
+
+    assert inventory_df[settings.INVENTORY_INVENTORY].tolist() == [3.5, 2.0, 4.0]
+    assert product_rows[settings.INVENTORY_INVENTORY].tolist() == [3.5, 2.0]
+
+def test_histogram_bins_of_small_integers_hold_one_value_each():
+    df = pd.DataFrame({'batch_count': np.repeat(np.arange(5, 11), 3)})
+
+    hist_df = dashboard.histogram_bins(df, 'batch_count', bins=20)
+
+    assert hist_df['batch_count'].tolist() == [5, 6, 7, 8, 9, 10]
+    assert hist_df['count'].tolist() == [3] * 6
+
+def test_histogram_bins_of_wide_integer_ranges_hold_whole_values():
+    df = pd.DataFrame({'dfc': np.arange(32)})
+
+    hist_df = dashboard.histogram_bins(df, 'dfc', bins=30)
+
+    assert hist_df['dfc'].tolist() == [2 * i + 0.5 for i in range(16)]
+    assert hist_df['count'].tolist() == [2] * 16
+
+def test_histogram_bins_of_dates_span_whole_days():
+    df = pd.DataFrame({'expiry_date': pd.to_datetime(['2024-08-01 00:00', '2024-08-01 00:00', '2024-08-03 18:00'])})
+
+    hist_df = dashboard.histogram_bins(df, 'expiry_date', bins=30)
+
+    assert hist_df['expiry_date'].tolist() == list(pd.to_datetime(['2024-08-01 12:00', '2024-08-02 12:00', '2024-08-03 12:00']))
+    assert hist_df['count'].tolist() == [2, 0, 1]
+
+def test_top_bottom_coverage_breaks_ties_by_row_position():
+    coverage_df = pd.DataFrame({
+        settings.COVERAGE_PRODUCT_ID: [f'P{i:02d}' for i in range(40)],
+        settings.COVERAGE_DAYS_FORWARD_COVERAGE: np.tile([5, 1, 9, 1, 9, 5, 3, 9], 5),
+    })
+
+    top_df, bottom_df = dashboard.top_bottom_coverage(coverage_df, n=10)
+
+    expected_top = coverage_df.nlargest(10, settings.COVERAGE_DAYS_FORWARD_COVERAGE, keep='first')
+    expected_bottom = coverage_df.nsmallest(10, settings.COVERAGE_DAYS_FORWARD_COVERAGE, keep='first')
+    assert top_df[settings.COVERAGE_PRODUCT_ID].tolist() == expected_top[settings.COVERAGE_PRODUCT_ID].tolist()
+    assert bottom_df[settings.COVERAGE_PRODUCT_ID].tolist() == expected_bottom[settings.COVERAGE_PRODUCT_ID].tolist()
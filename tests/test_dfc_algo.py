@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+
+from helpers.config import get_settings
+from helpers.dfc_algo import DFCAlgo, _days_covered_kernel
+
+def test_fractional_quantities_stop_at_the_last_batch():
+    # The running total used to drift above the batches left, so the FIFO loop read past the last batch
+    forecast_dates = np.arange(5, dtype=np.int64)
+    daily_demand = np.array([0.7, 0.9, 0.4, 0.4, 0.5])
+    expiry_dates = np.array([10, 10], dtype=np.int64)
+    batch_quantity = np.array([1.7, 1.2])
+
+    days_covered, total_inventory = _days_covered_kernel(forecast_dates, daily_demand, expiry_dates, batch_quantity)
+
+    assert days_covered == 4
+    assert total_inventory == np.float64(2.9)
+
+def forecast_frame(rows):
+    settings = get_settings()
+    return pd.DataFrame(rows, columns=[settings.FORCAST_PRODUCT_ID, settings.FORCAST_DATE, settings.FORCAST_FORECASTED_SALES]).astype({settings.FORCAST_DATE: 'datetime64[ns]'})
+
+def inventory_frame(rows):
+    settings = get_settings()
+    return pd.DataFrame(rows, columns=[settings.INVENTORY_PRODUCT_ID, settings.INVENTORY_BATCH_ID, settings.INVENTORY_EXPIRY_DATE, settings.INVENTORY_INVENTORY]).astype({settings.INVENTORY_EXPIRY_DATE: 'datetime64[ns]'})
+
+def test_calculate_dfc_expiry_and_fifo_carry_over():
+    settings = get_settings()
+    dates = pd.date_range('2024-08-01', periods=4)
+    forecast_df = forecast_frame(
+        [('A', date, 2) for date in dates]
+        + [('B', date, 1) for date in dates]
+        + [('D', date, 1) for date in dates]
+    )
+    inventory_df = inventory_frame([
+        # Expired before the first forecast date, so left out of the total
+        ('A', 'A_B0', '2024-07-31', 100),
+        ('A', 'A_B1', '2024-08-02', 3),
+        ('A', 'A_B2', '2024-08-31', 4),
+        ('B', 'B_B1', '2024-08-01', 3),
+        ('B', 'B_B2', '2024-08-31', 1),
+        ('C', 'C_B1', '2024-08-31', 5),
+    ])
+
+    coverage_df = DFCAlgo().calculate_dfc(forecast_df, inventory_df, save_csv=False)
+
+    # A: day 1 takes 2 of A_B1, day 2 the last unit of A_B1 and 1 of A_B2, day 3 2 more of A_B2, 1 left for day 4.
+    # B: day 1 takes 1 of B_B1, whose other 2 expire after day 1; day 2 takes B_B2, nothing left for day 3.
+    # C has no forecast and D has no inventory, so neither is covered.
+    assert coverage_df[settings.COVERAGE_PRODUCT_ID].tolist() == ['A', 'B', 'C', 'D']
+    assert coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE].tolist() == [3, 2, 0, 0]
+    assert coverage_df[settings.COVERAGE_TOTAL_INVENTORY].tolist() == [7, 4, 0, 0]
+    assert coverage_df['has_forecast'].tolist()[2:] == [False, True]
+    assert coverage_df['has_forecast'].iloc[:2].isna().all()
+
+def test_calculate_dfc_reports_missing_product_ids_as_one_uncovered_row():
+    settings = get_settings()
+    dates = pd.date_range('2024-08-01', periods=3)
+    forecast_df = forecast_frame([(product, date, 1) for product in 'AB' for date in dates])
+    inventory_df = inventory_frame([
+        ('A', 'A_B1', '2024-08-31', 5),
+        ('B', 'B_B1', '2024-08-31', 5),
+        (None, 'X_B1', '2024-08-31', 1000),
+    ])
+
+    coverage_df = DFCAlgo().calculate_dfc(forecast_df, inventory_df, save_csv=False)
+
+    assert coverage_df[settings.COVERAGE_PRODUCT_ID].tolist()[:2] == ['A', 'B']
+    assert pd.isna(coverage_df[settings.COVERAGE_PRODUCT_ID].iloc[2])
+    assert coverage_df[settings.COVERAGE_DAYS_FORWARD_COVERAGE].tolist() == [3, 3, 0]
+    assert coverage_df[settings.COVERAGE_TOTAL_INVENTORY].tolist() == [5, 5, 0]
+    assert coverage_df['has_forecast'].iloc[2] is False
+
+def test_calculate_dfc_with_empty_forecast():
+    settings = get_settings()
+    forecast_df = forecast_frame([])
+    inventory_df = inventory_frame([('A', 'A_B1', '2024-08-31', 5)])
+
+    coverage_df = DFCAlgo().calculate_dfc(forecast_df, inventory_df, save_csv=False)
+
+    assert coverage_df.empty
+    assert list(coverage_df.columns) == [settings.COVERAGE_PRODUCT_ID, settings.COVERAGE_DAYS_FORWARD_COVERAGE, settings.COVERAGE_TOTAL_INVENTORY]
+
+def test_calculate_dfc_over_time_restarts_from_full_batches_each_date():
+    dates = pd.date_range('2024-08-01', periods=5)
+    forecast_df = forecast_frame([('A', date, sales) for date, sales in zip(dates, [1, 2, 1, 2, 1])])
+    inventory_df = inventory_frame([
+        ('A', 'A_B1', '2024-08-02', 3),
+        ('A', 'A_B2', '2024-08-31', 3),
+    ])
+
+    dfc_over_time = DFCAlgo().calculate_dfc_over_time(forecast_df, inventory_df, 'A')
+
+    # From 08-03 on A_B1 has expired, so only A_B2's 3 units cover the remaining days
+    assert dfc_over_time['date'].tolist() == list(dates)
+    assert dfc_over_time['days_forward_coverage'].tolist() == [4, 3, 2, 2, 1]
+    assert dfc_over_time['total_inventory'].tolist() == [6, 6, 3, 3, 3]
+
+def test_calculate_dfc_over_time_for_unknown_product():
+    forecast_df = forecast_frame([('A', '2024-08-01', 1)])
+    inventory_df = inventory_frame([('A', 'A_B1', '2024-08-31', 5)])
+
+    assert DFCAlgo().calculate_dfc_over_time(forecast_df, inventory_df, 'B').empty